@@ -6,18 +6,53 @@ Scenario: TechCorp's acquisition of StartupXYZ
 Documents have cross-references to test the agent's ability to follow document relationships.
 """
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from __future__ import annotations
+
+import copy
+import functools
+import io
 import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+# ReportLab is a heavy import (fonts, XML machinery), so it is only loaded
+# inside the functions that render. Importing this module (for DOCUMENTS,
+# or as a pool worker on spawn platforms) does not pull it in, and neither
+# does the main process, which only compares and writes the rendered bytes.
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph
 
 OUTPUT_DIR = "data/test_acquisition"
 
-DOCUMENTS = {
-    "01_acquisition_agreement.pdf": {
-        "title": "ACQUISITION AGREEMENT",
-        "content": """
+# Cross-reference tags shared across documents. The agent is tested on
+# following these, so every document must cite the others by exactly the
+# same name; keeping each tag in one place guarantees that.
+REF_ACQUISITION_AGREEMENT = "<b>Document: Acquisition Agreement</b>"
+REF_DUE_DILIGENCE_REPORT = "<b>Document: Due Diligence Report</b>"
+REF_IP_CERTIFICATION_LETTER = "<b>Document: IP Certification Letter</b>"
+REF_RISK_ASSESSMENT_MEMO = "<b>Document: Risk Assessment Memo</b>"
+REF_FINANCIAL_ADJUSTMENTS_MEMO = "<b>Document: Financial Adjustments Memo</b>"
+REF_LEGAL_OPINION_LETTER = "<b>Document: Legal Opinion Letter</b>"
+REF_NON_DISCLOSURE_AGREEMENT = "<b>Document: Non-Disclosure Agreement</b>"
+REF_REGULATORY_APPROVAL_LETTER = "<b>Document: Regulatory Approval Letter</b>"
+REF_CUSTOMER_CONSENT_LETTERS = "<b>Document: Customer Consent Letters</b>"
+REF_CLOSING_CHECKLIST = "<b>Document: Closing Checklist</b>"
+REF_INTEGRATION_PLAN = "<b>Document: Integration Plan</b>"
+REF_EXHIBIT_A = "<b>Exhibit A - Financial Terms</b>"
+REF_EXHIBIT_B = "<b>Exhibit B - Stock Valuation</b>"
+REF_EXHIBIT_C = "<b>Exhibit C - Earnout Terms</b>"
+REF_SCHEDULE_1 = "<b>Schedule 1 - IP Assets</b>"
+REF_SCHEDULE_2 = "<b>Schedule 2 - Material Contracts</b>"
+REF_SCHEDULE_3 = "<b>Schedule 3 - Employee Transition Plan</b>"
+
+# (filename, title, content) for each document, in generation order
+DOCUMENTS = (
+    (
+        "01_acquisition_agreement.pdf",
+        "ACQUISITION AGREEMENT",
+        f"""
         <b>ACQUISITION AGREEMENT</b><br/><br/>
         
         This Acquisition Agreement ("Agreement") is entered into as of January 15, 2025, 
@@ -26,9 +61,9 @@ DOCUMENTS = {
         <b>ARTICLE I - DEFINITIONS</b><br/><br/>
         
         1.1 "Acquisition" means the purchase of all outstanding shares of Seller by Buyer.<br/>
-        1.2 "Purchase Price" means $45,000,000 USD as detailed in <b>Exhibit A - Financial Terms</b>.<br/>
+        1.2 "Purchase Price" means $45,000,000 USD as detailed in {REF_EXHIBIT_A}.<br/>
         1.3 "Closing Date" means March 1, 2025, subject to conditions in Article IV.<br/>
-        1.4 "Employee Matters" shall be governed by <b>Schedule 3 - Employee Transition Plan</b>.<br/><br/>
+        1.4 "Employee Matters" shall be governed by {REF_SCHEDULE_3}.<br/><br/>
         
         <b>ARTICLE II - PURCHASE AND SALE</b><br/><br/>
         
@@ -37,32 +72,32 @@ DOCUMENTS = {
         
         2.2 The Purchase Price shall be paid as follows:<br/>
         (a) $30,000,000 in cash at Closing<br/>
-        (b) $10,000,000 in Buyer's common stock (see <b>Exhibit B - Stock Valuation</b>)<br/>
-        (c) $5,000,000 in earnout payments (see <b>Exhibit C - Earnout Terms</b>)<br/><br/>
+        (b) $10,000,000 in Buyer's common stock (see {REF_EXHIBIT_B})<br/>
+        (c) $5,000,000 in earnout payments (see {REF_EXHIBIT_C})<br/><br/>
         
         <b>ARTICLE III - REPRESENTATIONS AND WARRANTIES</b><br/><br/>
         
         3.1 Seller represents and warrants that the financial statements provided in 
-        <b>Document: Due Diligence Report</b> are accurate and complete.<br/><br/>
+        {REF_DUE_DILIGENCE_REPORT} are accurate and complete.<br/><br/>
         
         3.2 Seller represents that all intellectual property is properly documented in 
-        <b>Schedule 1 - IP Assets</b> and is free of encumbrances as certified in 
-        <b>Document: IP Certification Letter</b>.<br/><br/>
+        {REF_SCHEDULE_1} and is free of encumbrances as certified in 
+        {REF_IP_CERTIFICATION_LETTER}.<br/><br/>
         
-        3.3 All material contracts are listed in <b>Schedule 2 - Material Contracts</b>.<br/><br/>
+        3.3 All material contracts are listed in {REF_SCHEDULE_2}.<br/><br/>
         
         <b>ARTICLE IV - CONDITIONS TO CLOSING</b><br/><br/>
         
         4.1 Buyer's obligation to close is subject to:<br/>
-        (a) Receipt of regulatory approval as documented in <b>Document: Regulatory Approval Letter</b><br/>
-        (b) Completion of due diligence per <b>Document: Due Diligence Report</b><br/>
+        (a) Receipt of regulatory approval as documented in {REF_REGULATORY_APPROVAL_LETTER}<br/>
+        (b) Completion of due diligence per {REF_DUE_DILIGENCE_REPORT}<br/>
         (c) No material adverse change as defined in Section 1.5<br/><br/>
         
-        4.2 Both parties acknowledge the risks identified in <b>Document: Risk Assessment Memo</b>.<br/><br/>
+        4.2 Both parties acknowledge the risks identified in {REF_RISK_ASSESSMENT_MEMO}.<br/><br/>
         
         <b>ARTICLE V - CONFIDENTIALITY</b><br/><br/>
         
-        5.1 This Agreement is subject to the terms of the <b>Document: Non-Disclosure Agreement</b> 
+        5.1 This Agreement is subject to the terms of the {REF_NON_DISCLOSURE_AGREEMENT} 
         executed between the parties on October 1, 2024.<br/><br/>
         
         IN WITNESS WHEREOF, the parties have executed this Agreement as of the date first above written.<br/><br/>
@@ -74,12 +109,12 @@ DOCUMENTS = {
         _________________________<br/>
         StartupXYZ LLC<br/>
         By: Sarah Chen, Founder & CEO
-        """
-    },
-    
-    "02_due_diligence_report.pdf": {
-        "title": "DUE DILIGENCE REPORT",
-        "content": """
+        """,
+    ),
+    (
+        "02_due_diligence_report.pdf",
+        "DUE DILIGENCE REPORT",
+        f"""
         <b>CONFIDENTIAL DUE DILIGENCE REPORT</b><br/><br/>
         
         <b>Prepared for:</b> TechCorp Industries, Inc.<br/>
@@ -90,59 +125,59 @@ DOCUMENTS = {
         <b>EXECUTIVE SUMMARY</b><br/><br/>
         
         This report summarizes our findings from the due diligence investigation of StartupXYZ LLC 
-        in connection with the proposed acquisition described in the <b>Document: Acquisition Agreement</b>.<br/><br/>
+        in connection with the proposed acquisition described in the {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
         <b>1. FINANCIAL REVIEW</b><br/><br/>
         
         1.1 Revenue for FY2024: $12.3 million (growth of 45% YoY)<br/>
         1.2 EBITDA: $2.1 million (17% margin)<br/>
         1.3 Cash position: $3.2 million as of November 30, 2024<br/>
-        1.4 Outstanding debt: $1.5 million (detailed in <b>Exhibit A - Financial Terms</b> of the Acquisition Agreement)<br/><br/>
+        1.4 Outstanding debt: $1.5 million (detailed in {REF_EXHIBIT_A} of the Acquisition Agreement)<br/><br/>
         
         <b>KEY FINDING:</b> Financial statements are materially accurate. Minor adjustments 
-        recommended as noted in <b>Document: Financial Adjustments Memo</b>.<br/><br/>
+        recommended as noted in {REF_FINANCIAL_ADJUSTMENTS_MEMO}.<br/><br/>
         
         <b>2. INTELLECTUAL PROPERTY</b><br/><br/>
         
         2.1 StartupXYZ holds 12 patents related to AI/ML technology<br/>
-        2.2 All patents verified as valid per <b>Document: IP Certification Letter</b><br/>
-        2.3 No pending litigation affecting IP (confirmed in <b>Document: Legal Opinion Letter</b>)<br/>
-        2.4 Full IP inventory in <b>Schedule 1 - IP Assets</b> of the Acquisition Agreement<br/><br/>
+        2.2 All patents verified as valid per {REF_IP_CERTIFICATION_LETTER}<br/>
+        2.3 No pending litigation affecting IP (confirmed in {REF_LEGAL_OPINION_LETTER})<br/>
+        2.4 Full IP inventory in {REF_SCHEDULE_1} of the Acquisition Agreement<br/><br/>
         
         <b>3. EMPLOYEE MATTERS</b><br/><br/>
         
         3.1 Total employees: 47 (32 engineering, 8 sales, 7 operations)<br/>
         3.2 Key employee retention risk: HIGH for 5 senior engineers<br/>
-        3.3 Retention bonuses recommended per <b>Schedule 3 - Employee Transition Plan</b><br/>
+        3.3 Retention bonuses recommended per {REF_SCHEDULE_3}<br/>
         3.4 No pending employment disputes<br/><br/>
         
         <b>4. MATERIAL CONTRACTS</b><br/><br/>
         
-        4.1 23 active customer contracts reviewed (see <b>Schedule 2 - Material Contracts</b>)<br/>
+        4.1 23 active customer contracts reviewed (see {REF_SCHEDULE_2})<br/>
         4.2 3 contracts contain change-of-control provisions requiring consent<br/>
         4.3 Largest customer (MegaCorp) accounts for 28% of revenue - concentration risk noted in 
-        <b>Document: Risk Assessment Memo</b><br/><br/>
+        {REF_RISK_ASSESSMENT_MEMO}<br/><br/>
         
         <b>5. REGULATORY COMPLIANCE</b><br/><br/>
         
         5.1 Company is compliant with all applicable regulations<br/>
-        5.2 HSR filing required - timeline in <b>Document: Regulatory Approval Letter</b><br/><br/>
+        5.2 HSR filing required - timeline in {REF_REGULATORY_APPROVAL_LETTER}<br/><br/>
         
         <b>6. RECOMMENDATIONS</b><br/><br/>
         
         Based on our findings, we recommend proceeding with the acquisition subject to:<br/>
         (a) Obtaining customer consents for change-of-control contracts<br/>
         (b) Implementing retention packages for key employees<br/>
-        (c) Addressing items in <b>Document: Financial Adjustments Memo</b><br/><br/>
+        (c) Addressing items in {REF_FINANCIAL_ADJUSTMENTS_MEMO}<br/><br/>
         
         Respectfully submitted,<br/>
         Morrison & Associates, LLP
-        """
-    },
-    
-    "03_ip_certification.pdf": {
-        "title": "IP CERTIFICATION LETTER",
-        "content": """
+        """,
+    ),
+    (
+        "03_ip_certification.pdf",
+        "IP CERTIFICATION LETTER",
+        f"""
         <b>INTELLECTUAL PROPERTY CERTIFICATION LETTER</b><br/><br/>
         
         <b>Date:</b> December 15, 2024<br/>
@@ -153,7 +188,7 @@ DOCUMENTS = {
         Dear Mr. Mitchell,<br/><br/>
         
         In connection with the proposed acquisition of StartupXYZ LLC as described in the 
-        <b>Document: Acquisition Agreement</b>, we have conducted a comprehensive review of 
+        {REF_ACQUISITION_AGREEMENT}, we have conducted a comprehensive review of 
         StartupXYZ's intellectual property portfolio.<br/><br/>
         
         <b>CERTIFICATION</b><br/><br/>
@@ -162,7 +197,7 @@ DOCUMENTS = {
         
         <b>1. PATENTS</b><br/><br/>
         
-        StartupXYZ owns 12 U.S. patents as listed in <b>Schedule 1 - IP Assets</b>:<br/>
+        StartupXYZ owns 12 U.S. patents as listed in {REF_SCHEDULE_1}:<br/>
         - US Patent 10,123,456: "Neural Network Optimization Method"<br/>
         - US Patent 10,234,567: "Distributed AI Training System"<br/>
         - US Patent 10,345,678: "Real-time Data Processing Pipeline"<br/>
@@ -180,7 +215,7 @@ DOCUMENTS = {
         <b>3. TRADE SECRETS</b><br/><br/>
         
         We have reviewed StartupXYZ's trade secret protection protocols. All employees have 
-        signed appropriate NDAs. See <b>Document: Non-Disclosure Agreement</b> template.<br/><br/>
+        signed appropriate NDAs. See {REF_NON_DISCLOSURE_AGREEMENT} template.<br/><br/>
         
         <b>4. THIRD-PARTY IP</b><br/><br/>
         
@@ -191,12 +226,12 @@ DOCUMENTS = {
         
         There is one pending patent application (Application No. 17/456,789) for "Advanced 
         Federated Learning System" expected to issue Q2 2025. This is noted in 
-        <b>Document: Risk Assessment Memo</b> as a minor risk item.<br/><br/>
+        {REF_RISK_ASSESSMENT_MEMO} as a minor risk item.<br/><br/>
         
         <b>6. LITIGATION</b><br/><br/>
         
         No IP-related litigation is pending or threatened. This is confirmed in 
-        <b>Document: Legal Opinion Letter</b>.<br/><br/>
+        {REF_LEGAL_OPINION_LETTER}.<br/><br/>
         
         This certification is provided in connection with the due diligence process and 
         may be relied upon by TechCorp Industries, Inc.<br/><br/>
@@ -204,12 +239,12 @@ DOCUMENTS = {
         Sincerely,<br/>
         PatentWatch Legal Services<br/>
         By: Robert Kim, Patent Attorney
-        """
-    },
-    
-    "04_risk_assessment.pdf": {
-        "title": "RISK ASSESSMENT MEMO",
-        "content": """
+        """,
+    ),
+    (
+        "04_risk_assessment.pdf",
+        "RISK ASSESSMENT MEMO",
+        f"""
         <b>CONFIDENTIAL RISK ASSESSMENT MEMORANDUM</b><br/><br/>
         
         <b>To:</b> TechCorp Board of Directors<br/>
@@ -218,69 +253,69 @@ DOCUMENTS = {
         <b>Re:</b> Risk Assessment - StartupXYZ Acquisition<br/><br/>
         
         This memo summarizes key risks identified in connection with the proposed acquisition 
-        as documented in the <b>Document: Acquisition Agreement</b>.<br/><br/>
+        as documented in the {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
         <b>1. HIGH-PRIORITY RISKS</b><br/><br/>
         
         <b>1.1 Customer Concentration (HIGH)</b><br/>
         - MegaCorp represents 28% of StartupXYZ revenue<br/>
         - MegaCorp contract contains change-of-control clause<br/>
-        - Mitigation: Obtain consent prior to closing (see <b>Document: Customer Consent Letters</b>)<br/>
+        - Mitigation: Obtain consent prior to closing (see {REF_CUSTOMER_CONSENT_LETTERS})<br/>
         - Impact if materialized: $3.4M annual revenue at risk<br/><br/>
         
         <b>1.2 Key Employee Retention (HIGH)</b><br/>
         - 5 senior engineers critical to product development<br/>
         - 2 have expressed interest in leaving post-acquisition<br/>
-        - Mitigation: Retention packages per <b>Schedule 3 - Employee Transition Plan</b><br/>
+        - Mitigation: Retention packages per {REF_SCHEDULE_3}<br/>
         - Estimated cost: $2.5M in retention bonuses<br/><br/>
         
         <b>2. MEDIUM-PRIORITY RISKS</b><br/><br/>
         
         <b>2.1 Earnout Structure (MEDIUM)</b><br/>
         - $5M earnout tied to 2025-2026 performance metrics<br/>
-        - Metrics defined in <b>Exhibit C - Earnout Terms</b> of the Acquisition Agreement<br/>
+        - Metrics defined in {REF_EXHIBIT_C} of the Acquisition Agreement<br/>
         - Risk: Disagreement on metric calculation methodology<br/>
         - Mitigation: Clear definitions in agreement; third-party arbitration clause<br/><br/>
         
         <b>2.2 Integration Costs (MEDIUM)</b><br/>
         - Estimated integration costs: $4.2M over 18 months<br/>
-        - Systems integration detailed in <b>Document: Integration Plan</b><br/>
+        - Systems integration detailed in {REF_INTEGRATION_PLAN}<br/>
         - Risk: Cost overruns of 20-30% typical in tech acquisitions<br/><br/>
         
         <b>3. LOW-PRIORITY RISKS</b><br/><br/>
         
         <b>3.1 Pending Patent Application (LOW)</b><br/>
-        - One patent pending as noted in <b>Document: IP Certification Letter</b><br/>
+        - One patent pending as noted in {REF_IP_CERTIFICATION_LETTER}<br/>
         - Low risk of rejection based on patent attorney's assessment<br/><br/>
         
         <b>3.2 Regulatory Approval (LOW)</b><br/>
         - HSR filing required but expected to clear without issues<br/>
-        - Timeline in <b>Document: Regulatory Approval Letter</b><br/><br/>
+        - Timeline in {REF_REGULATORY_APPROVAL_LETTER}<br/><br/>
         
         <b>4. FINANCIAL IMPACT SUMMARY</b><br/><br/>
         
         Total risk-adjusted impact: $6.2M - $8.7M<br/>
-        This is reflected in purchase price negotiations per <b>Document: Financial Adjustments Memo</b><br/><br/>
+        This is reflected in purchase price negotiations per {REF_FINANCIAL_ADJUSTMENTS_MEMO}<br/><br/>
         
         <b>5. RECOMMENDATION</b><br/><br/>
         
         Despite identified risks, we recommend proceeding with the acquisition. The strategic 
         value of StartupXYZ's AI technology platform justifies the purchase price when 
         accounting for risk mitigation costs. All findings are consistent with 
-        <b>Document: Due Diligence Report</b>.<br/><br/>
+        {REF_DUE_DILIGENCE_REPORT}.<br/><br/>
         
         <b>6. NEXT STEPS</b><br/><br/>
         
         - Finalize customer consent process<br/>
         - Execute retention agreements<br/>
         - Complete regulatory filings<br/>
-        - Prepare for closing per <b>Document: Closing Checklist</b>
-        """
-    },
-    
-    "05_financial_adjustments.pdf": {
-        "title": "FINANCIAL ADJUSTMENTS MEMO",
-        "content": """
+        - Prepare for closing per {REF_CLOSING_CHECKLIST}
+        """,
+    ),
+    (
+        "05_financial_adjustments.pdf",
+        "FINANCIAL ADJUSTMENTS MEMO",
+        f"""
         <b>FINANCIAL ADJUSTMENTS MEMORANDUM</b><br/><br/>
         
         <b>To:</b> Deal Team<br/>
@@ -288,9 +323,9 @@ DOCUMENTS = {
         <b>Date:</b> December 23, 2024<br/>
         <b>Re:</b> Purchase Price Adjustments - StartupXYZ Acquisition<br/><br/>
         
-        Following our review in connection with the <b>Document: Due Diligence Report</b>, 
+        Following our review in connection with the {REF_DUE_DILIGENCE_REPORT}, 
         we recommend the following adjustments to the purchase price as set forth in 
-        <b>Exhibit A - Financial Terms</b> of the <b>Document: Acquisition Agreement</b>.<br/><br/>
+        {REF_EXHIBIT_A} of the {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
         <b>1. WORKING CAPITAL ADJUSTMENT</b><br/><br/>
         
@@ -312,11 +347,11 @@ DOCUMENTS = {
         
         <b>4. CONTINGENT LIABILITY RESERVE</b><br/><br/>
         
-        As noted in <b>Document: Risk Assessment Memo</b>, we recommend establishing 
+        As noted in {REF_RISK_ASSESSMENT_MEMO}, we recommend establishing 
         reserves for:<br/>
         - Customer concentration risk: $500,000<br/>
         - Integration contingency: $800,000<br/>
-        Total reserve: $1,300,000 (to be held in escrow per <b>Exhibit C - Earnout Terms</b>)<br/><br/>
+        Total reserve: $1,300,000 (to be held in escrow per {REF_EXHIBIT_C})<br/><br/>
         
         <b>5. SUMMARY OF ADJUSTMENTS</b><br/><br/>
         
@@ -331,22 +366,22 @@ DOCUMENTS = {
         
         <b>6. PAYMENT STRUCTURE</b><br/><br/>
         
-        As revised from <b>Document: Acquisition Agreement</b> Section 2.2:<br/>
+        As revised from {REF_ACQUISITION_AGREEMENT} Section 2.2:<br/>
         (a) Cash at closing: $28,330,000 (adjusted)<br/>
-        (b) Stock consideration: $10,000,000 (per <b>Exhibit B - Stock Valuation</b>)<br/>
-        (c) Earnout: $5,000,000 (unchanged, per <b>Exhibit C - Earnout Terms</b>)<br/>
+        (b) Stock consideration: $10,000,000 (per {REF_EXHIBIT_B})<br/>
+        (c) Earnout: $5,000,000 (unchanged, per {REF_EXHIBIT_C})<br/>
         (d) Escrow: $1,300,000 (18-month release schedule)<br/><br/>
         
         These adjustments have been discussed with Seller's representatives and are 
         subject to final negotiation.<br/><br/>
         
-        Please refer to <b>Document: Closing Checklist</b> for timeline and requirements.
-        """
-    },
-    
-    "06_legal_opinion.pdf": {
-        "title": "LEGAL OPINION LETTER",
-        "content": """
+        Please refer to {REF_CLOSING_CHECKLIST} for timeline and requirements.
+        """,
+    ),
+    (
+        "06_legal_opinion.pdf",
+        "LEGAL OPINION LETTER",
+        f"""
         <b>LEGAL OPINION LETTER</b><br/><br/>
         
         <b>Date:</b> December 18, 2024<br/><br/>
@@ -361,17 +396,17 @@ DOCUMENTS = {
         
         We have acted as legal counsel to StartupXYZ LLC ("Company") in connection with 
         the proposed acquisition by TechCorp Industries, Inc. pursuant to the 
-        <b>Document: Acquisition Agreement</b> dated January 15, 2025.<br/><br/>
+        {REF_ACQUISITION_AGREEMENT} dated January 15, 2025.<br/><br/>
         
         <b>DOCUMENTS REVIEWED</b><br/><br/>
         
         In connection with this opinion, we have reviewed:<br/>
         1. The Acquisition Agreement and all Exhibits and Schedules<br/>
-        2. <b>Document: Due Diligence Report</b> prepared by Morrison & Associates<br/>
-        3. <b>Document: IP Certification Letter</b> from PatentWatch Legal Services<br/>
-        4. All material contracts listed in <b>Schedule 2 - Material Contracts</b><br/>
+        2. {REF_DUE_DILIGENCE_REPORT} prepared by Morrison & Associates<br/>
+        3. {REF_IP_CERTIFICATION_LETTER} from PatentWatch Legal Services<br/>
+        4. All material contracts listed in {REF_SCHEDULE_2}<br/>
         5. Corporate records and organizational documents of the Company<br/>
-        6. <b>Document: Non-Disclosure Agreement</b> between the parties<br/><br/>
+        6. {REF_NON_DISCLOSURE_AGREEMENT} between the parties<br/><br/>
         
         <b>OPINIONS</b><br/><br/>
         
@@ -388,19 +423,19 @@ DOCUMENTS = {
         <b>3. No Conflicts</b><br/>
         The execution and delivery of the Acquisition Agreement does not violate any 
         provision of the Company's organizational documents or any material contract, 
-        except for change-of-control provisions noted in <b>Document: Customer Consent Letters</b>.<br/><br/>
+        except for change-of-control provisions noted in {REF_CUSTOMER_CONSENT_LETTERS}.<br/><br/>
         
         <b>4. Litigation</b><br/>
         There is no litigation, arbitration, or governmental proceeding pending or, to 
         our knowledge, threatened against the Company that would have a material adverse 
         effect on the Company or the transactions contemplated by the Acquisition Agreement.<br/><br/>
         
-        This opinion confirms the representations in the <b>Document: IP Certification Letter</b> 
+        This opinion confirms the representations in the {REF_IP_CERTIFICATION_LETTER} 
         regarding absence of IP litigation.<br/><br/>
         
         <b>5. Regulatory Compliance</b><br/>
         The Company is in material compliance with all applicable laws and regulations. 
-        The HSR filing requirements are addressed in <b>Document: Regulatory Approval Letter</b>.<br/><br/>
+        The HSR filing requirements are addressed in {REF_REGULATORY_APPROVAL_LETTER}.<br/><br/>
         
         <b>QUALIFICATIONS</b><br/><br/>
         
@@ -415,12 +450,12 @@ DOCUMENTS = {
         Very truly yours,<br/>
         Wilson & Partners LLP<br/>
         By: Jennifer Walsh, Partner
-        """
-    },
-    
-    "07_nda.pdf": {
-        "title": "NON-DISCLOSURE AGREEMENT",
-        "content": """
+        """,
+    ),
+    (
+        "07_nda.pdf",
+        "NON-DISCLOSURE AGREEMENT",
+        f"""
         <b>MUTUAL NON-DISCLOSURE AGREEMENT</b><br/><br/>
         
         This Mutual Non-Disclosure Agreement ("NDA") is entered into as of October 1, 2024, 
@@ -440,17 +475,17 @@ DOCUMENTS = {
         
         The Parties wish to explore a potential business relationship, including a possible 
         acquisition of StartupXYZ by TechCorp (the "Purpose"), which is now documented in 
-        the <b>Document: Acquisition Agreement</b>.<br/><br/>
+        the {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
         <b>1. DEFINITION OF CONFIDENTIAL INFORMATION</b><br/><br/>
         
         "Confidential Information" means any non-public information disclosed by either 
         Party, including but not limited to:<br/>
-        - Financial information (as contained in <b>Document: Due Diligence Report</b>)<br/>
-        - Technical information (as certified in <b>Document: IP Certification Letter</b>)<br/>
+        - Financial information (as contained in {REF_DUE_DILIGENCE_REPORT})<br/>
+        - Technical information (as certified in {REF_IP_CERTIFICATION_LETTER})<br/>
         - Business strategies and plans<br/>
         - Customer and supplier information<br/>
-        - Employee information (as detailed in <b>Schedule 3 - Employee Transition Plan</b>)<br/><br/>
+        - Employee information (as detailed in {REF_SCHEDULE_3})<br/><br/>
         
         <b>2. OBLIGATIONS</b><br/><br/>
         
@@ -464,7 +499,7 @@ DOCUMENTS = {
         
         This NDA shall remain in effect for three (3) years from the date first written 
         above, or until superseded by the confidentiality provisions in the 
-        <b>Document: Acquisition Agreement</b> Article V.<br/><br/>
+        {REF_ACQUISITION_AGREEMENT} Article V.<br/><br/>
         
         <b>4. EXCLUSIONS</b><br/><br/>
         
@@ -482,8 +517,8 @@ DOCUMENTS = {
         <b>6. NO LICENSE</b><br/><br/>
         
         Nothing in this NDA grants any rights to intellectual property, except as 
-        subsequently agreed in the <b>Document: Acquisition Agreement</b> and 
-        <b>Schedule 1 - IP Assets</b>.<br/><br/>
+        subsequently agreed in the {REF_ACQUISITION_AGREEMENT} and 
+        {REF_SCHEDULE_1}.<br/><br/>
         
         IN WITNESS WHEREOF, the Parties have executed this NDA as of the date first above written.<br/><br/>
         
@@ -496,12 +531,12 @@ DOCUMENTS = {
         By: ______________________<br/>
         Name: Sarah Chen<br/>
         Title: Founder & CEO
-        """
-    },
-    
-    "08_regulatory_approval.pdf": {
-        "title": "REGULATORY APPROVAL LETTER",
-        "content": """
+        """,
+    ),
+    (
+        "08_regulatory_approval.pdf",
+        "REGULATORY APPROVAL LETTER",
+        f"""
         <b>FEDERAL TRADE COMMISSION</b><br/>
         <b>PREMERGER NOTIFICATION OFFICE</b><br/><br/>
         
@@ -527,7 +562,7 @@ DOCUMENTS = {
         <b>FILING DETAILS</b><br/><br/>
         
         Filing Date: January 10, 2025<br/>
-        Transaction Value: $45,000,000 (as stated in <b>Document: Acquisition Agreement</b>)<br/>
+        Transaction Value: $45,000,000 (as stated in {REF_ACQUISITION_AGREEMENT})<br/>
         HSR Filing Fee: $30,000<br/>
         Early Termination Granted: January 28, 2025<br/><br/>
         
@@ -535,30 +570,30 @@ DOCUMENTS = {
         
         The parties may now consummate the transaction at any time. This early termination 
         satisfies the condition precedent set forth in Article IV, Section 4.1(a) of the 
-        <b>Document: Acquisition Agreement</b>.<br/><br/>
+        {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
         Please note that early termination of the waiting period does not preclude the 
         Commission from taking any action it deems necessary to protect competition.<br/><br/>
         
         <b>NEXT STEPS</b><br/><br/>
         
-        Per the <b>Document: Closing Checklist</b>, you may now proceed with the closing 
+        Per the {REF_CLOSING_CHECKLIST}, you may now proceed with the closing 
         scheduled for March 1, 2025, subject to satisfaction of other conditions in the 
-        <b>Document: Acquisition Agreement</b>.<br/><br/>
+        {REF_ACQUISITION_AGREEMENT}.<br/><br/>
         
-        The <b>Document: Risk Assessment Memo</b> correctly identified this as a low-risk 
-        item. The market analysis in the <b>Document: Due Diligence Report</b> supported 
+        The {REF_RISK_ASSESSMENT_MEMO} correctly identified this as a low-risk 
+        item. The market analysis in the {REF_DUE_DILIGENCE_REPORT} supported 
         the determination that this transaction does not raise competitive concerns.<br/><br/>
         
         Sincerely,<br/>
         Premerger Notification Office<br/>
         Federal Trade Commission
-        """
-    },
-    
-    "09_customer_consents.pdf": {
-        "title": "CUSTOMER CONSENT LETTERS",
-        "content": """
+        """,
+    ),
+    (
+        "09_customer_consents.pdf",
+        "CUSTOMER CONSENT LETTERS",
+        f"""
         <b>CUSTOMER CONSENT STATUS REPORT</b><br/><br/>
         
         <b>Date:</b> February 15, 2025<br/>
@@ -566,8 +601,8 @@ DOCUMENTS = {
         <b>From:</b> Legal Department<br/>
         <b>Re:</b> Change of Control Consent Status<br/><br/>
         
-        As required by <b>Schedule 2 - Material Contracts</b> of the 
-        <b>Document: Acquisition Agreement</b>, this memo summarizes the status of 
+        As required by {REF_SCHEDULE_2} of the 
+        {REF_ACQUISITION_AGREEMENT}, this memo summarizes the status of 
         customer consents for contracts containing change-of-control provisions.<br/><br/>
         
         <b>CONSENT STATUS SUMMARY</b><br/><br/>
@@ -577,7 +612,7 @@ DOCUMENTS = {
         Consent Received: February 10, 2025<br/>
         Notes: MegaCorp requested meeting with TechCorp leadership; meeting held 2/8/25. 
         Consent granted with no additional conditions. This addresses the primary concern 
-        noted in <b>Document: Risk Assessment Memo</b> Section 1.1.<br/><br/>
+        noted in {REF_RISK_ASSESSMENT_MEMO} Section 1.1.<br/><br/>
         
         <b>2. DataFlow Systems - OBTAINED</b><br/>
         Contract Value: $1.2M annual<br/>
@@ -589,22 +624,22 @@ DOCUMENTS = {
         Status: Consent requested February 1, 2025<br/>
         Expected: February 20, 2025<br/>
         Notes: Legal review in progress at CloudTech. Their counsel has reviewed the 
-        <b>Document: Acquisition Agreement</b> and has no objections. Verbal confirmation 
+        {REF_ACQUISITION_AGREEMENT} and has no objections. Verbal confirmation 
         received; written consent expected shortly.<br/><br/>
         
         <b>IMPACT ANALYSIS</b><br/><br/>
         
-        Per <b>Document: Due Diligence Report</b> Section 4, there were 3 contracts 
+        Per {REF_DUE_DILIGENCE_REPORT} Section 4, there were 3 contracts 
         requiring consent:<br/>
         - 2 obtained (representing $4.6M annual revenue)<br/>
         - 1 pending (representing $890K annual revenue)<br/><br/>
         
         <b>CLOSING IMPLICATIONS</b><br/><br/>
         
-        The <b>Document: Acquisition Agreement</b> Article IV requires "material" customer 
+        The {REF_ACQUISITION_AGREEMENT} Article IV requires "material" customer 
         consents as a closing condition. With MegaCorp consent obtained, this condition 
         is substantially satisfied. The pending CloudTech consent is expected before 
-        the March 1 closing date per <b>Document: Closing Checklist</b>.<br/><br/>
+        the March 1 closing date per {REF_CLOSING_CHECKLIST}.<br/><br/>
         
         <b>ATTACHMENTS</b><br/><br/>
         
@@ -617,13 +652,13 @@ DOCUMENTS = {
         
         We recommend proceeding with closing preparations. The risk of CloudTech 
         withholding consent is low based on discussions with their counsel. This 
-        is consistent with the risk mitigation strategy in <b>Document: Risk Assessment Memo</b>.
-        """
-    },
-    
-    "10_closing_checklist.pdf": {
-        "title": "CLOSING CHECKLIST",
-        "content": """
+        is consistent with the risk mitigation strategy in {REF_RISK_ASSESSMENT_MEMO}.
+        """,
+    ),
+    (
+        "10_closing_checklist.pdf",
+        "CLOSING CHECKLIST",
+        f"""
         <b>CLOSING CHECKLIST</b><br/>
         <b>Acquisition of StartupXYZ LLC by TechCorp Industries, Inc.</b><br/><br/>
         
@@ -633,28 +668,28 @@ DOCUMENTS = {
         <b>I. PRE-CLOSING CONDITIONS</b><br/><br/>
         
         <b>A. Regulatory</b><br/>
-        [X] HSR Filing submitted - <b>Document: Regulatory Approval Letter</b><br/>
+        [X] HSR Filing submitted - {REF_REGULATORY_APPROVAL_LETTER}<br/>
         [X] Early termination received (January 28, 2025)<br/>
         [ ] State regulatory filings (if required)<br/><br/>
         
         <b>B. Third-Party Consents</b><br/>
-        [X] MegaCorp consent - <b>Document: Customer Consent Letters</b><br/>
-        [X] DataFlow consent - <b>Document: Customer Consent Letters</b><br/>
-        [ ] CloudTech consent (expected February 20) - <b>Document: Customer Consent Letters</b><br/><br/>
+        [X] MegaCorp consent - {REF_CUSTOMER_CONSENT_LETTERS}<br/>
+        [X] DataFlow consent - {REF_CUSTOMER_CONSENT_LETTERS}<br/>
+        [ ] CloudTech consent (expected February 20) - {REF_CUSTOMER_CONSENT_LETTERS}<br/><br/>
         
         <b>C. Due Diligence Completion</b><br/>
-        [X] Financial due diligence - <b>Document: Due Diligence Report</b><br/>
-        [X] Legal due diligence - <b>Document: Legal Opinion Letter</b><br/>
-        [X] IP due diligence - <b>Document: IP Certification Letter</b><br/>
-        [X] Risk assessment - <b>Document: Risk Assessment Memo</b><br/><br/>
+        [X] Financial due diligence - {REF_DUE_DILIGENCE_REPORT}<br/>
+        [X] Legal due diligence - {REF_LEGAL_OPINION_LETTER}<br/>
+        [X] IP due diligence - {REF_IP_CERTIFICATION_LETTER}<br/>
+        [X] Risk assessment - {REF_RISK_ASSESSMENT_MEMO}<br/><br/>
         
         <b>II. CLOSING DOCUMENTS</b><br/><br/>
         
         <b>A. Transaction Documents</b><br/>
-        [ ] Executed <b>Document: Acquisition Agreement</b><br/>
+        [ ] Executed {REF_ACQUISITION_AGREEMENT}<br/>
         [ ] Bill of Sale<br/>
         [ ] Assignment and Assumption Agreement<br/>
-        [ ] IP Assignment Agreement (per <b>Schedule 1 - IP Assets</b>)<br/><br/>
+        [ ] IP Assignment Agreement (per {REF_SCHEDULE_1})<br/><br/>
         
         <b>B. Corporate Documents</b><br/>
         [ ] Seller's Certificate of Good Standing<br/>
@@ -662,19 +697,19 @@ DOCUMENTS = {
         [ ] Buyer's Certificate of Good Standing<br/><br/>
         
         <b>C. Financial Documents</b><br/>
-        [ ] Closing Statement per <b>Document: Financial Adjustments Memo</b><br/>
+        [ ] Closing Statement per {REF_FINANCIAL_ADJUSTMENTS_MEMO}<br/>
         [ ] Wire transfer instructions<br/>
-        [ ] Escrow Agreement (per <b>Exhibit C - Earnout Terms</b>)<br/>
-        [ ] Stock certificates or book entry (per <b>Exhibit B - Stock Valuation</b>)<br/><br/>
+        [ ] Escrow Agreement (per {REF_EXHIBIT_C})<br/>
+        [ ] Stock certificates or book entry (per {REF_EXHIBIT_B})<br/><br/>
         
         <b>D. Employment Documents</b><br/>
-        [ ] Retention agreements per <b>Schedule 3 - Employee Transition Plan</b><br/>
+        [ ] Retention agreements per {REF_SCHEDULE_3}<br/>
         [ ] Offer letters for key employees<br/>
         [ ] WARN Act compliance (if applicable)<br/><br/>
         
         <b>III. CLOSING FUNDS</b><br/><br/>
         
-        Per <b>Document: Financial Adjustments Memo</b>:<br/>
+        Per {REF_FINANCIAL_ADJUSTMENTS_MEMO}:<br/>
         [ ] Cash payment: $28,330,000<br/>
         [ ] Escrow deposit: $1,300,000<br/>
         [ ] Stock issuance: $10,000,000<br/>
@@ -684,7 +719,7 @@ DOCUMENTS = {
         
         [ ] File UCC termination statements<br/>
         [ ] Update corporate records<br/>
-        [ ] Integration kickoff per <b>Document: Integration Plan</b><br/>
+        [ ] Integration kickoff per {REF_INTEGRATION_PLAN}<br/>
         [ ] Employee communications<br/>
         [ ] Customer notifications<br/>
         [ ] Press release<br/><br/>
@@ -701,46 +736,145 @@ DOCUMENTS = {
         StartupXYZ: Sarah Chen (CEO), (650) 555-0200<br/>
         Legal (Buyer): John Morrison, (415) 555-0300<br/>
         Legal (Seller): Jennifer Walsh, (415) 555-0400
-        """
-    }
-}
+        """,
+    ),
+)
 
 
-def create_pdf(filename: str, title: str, content: str):
-    """Create a PDF document."""
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    doc = SimpleDocTemplate(filepath, pagesize=letter,
-                           topMargin=1*inch, bottomMargin=1*inch,
-                           leftMargin=1*inch, rightMargin=1*inch)
-    
-    styles = getSampleStyleSheet()
+# The literals above are indented and wrapped to match the source. The
+# paragraph parser treats any run of whitespace as one space, so collapse
+# them once here and give it less to tokenize.
+DOCUMENTS = tuple(
+    (filename, title, " ".join(content.split()))
+    for filename, title, content in DOCUMENTS
+)
+
+@functools.lru_cache(maxsize=None)
+def _styles() -> tuple[ParagraphStyle, ParagraphStyle]:
+    """Import ReportLab and build the (title, body) styles, once per process.
+
+    The styles are spelled out in full (the values Heading1/Normal from
+    getSampleStyleSheet() would supply) rather than building the whole
+    sample sheet just to inherit from two of its styles.
+    """
+    from reportlab import rl_config
+
+    # Trusted, canned content: skip ReportLab's attribute validation. This
+    # has to be set before anything pulls in reportlab.graphics, which
+    # reads it at import time.
+    rl_config.shapeChecking = 0
+
+    from reportlab.lib.styles import ParagraphStyle
+
     title_style = ParagraphStyle(
         'CustomTitle',
-        parent=styles['Heading1'],
+        fontName='Helvetica-Bold',
         fontSize=16,
+        leading=22,
         spaceAfter=30,
         alignment=1  # Center
     )
     body_style = ParagraphStyle(
         'CustomBody',
-        parent=styles['Normal'],
+        fontName='Helvetica',
         fontSize=11,
         leading=14,
         spaceAfter=12
     )
+    return title_style, body_style
+
+
+@functools.lru_cache(maxsize=None)
+def _split_paragraphs(content: str) -> tuple[str, ...]:
+    """Split a document body into its <br/><br/>-separated blocks."""
+    return tuple(content.strip().split('<br/><br/>'))
+
+
+@functools.lru_cache(maxsize=512)
+def _paragraph_prototype(html: str, style: ParagraphStyle) -> Paragraph:
+    """Parse a Paragraph once per distinct (markup, style) pair."""
+    from reportlab.platypus import Paragraph
+
+    return Paragraph(html, style)
+
+
+def _make_para(html: str, style: ParagraphStyle) -> Paragraph:
+    """Return a Paragraph for html, reusing the parsed prototype.
+
+    Paragraphs record layout state on wrap(), so each use gets a shallow
+    copy; the parsed fragments are shared read-only.
+    """
+    return copy.copy(_paragraph_prototype(html, style))
+
+
+def render_pdf(title: str, content: str) -> bytes:
+    """Render a PDF document into memory and return its bytes."""
+    title_style, body_style = _styles()
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Spacer
+
+    # One small Paragraph per block keeps each wrap/split pass cheap
+    story = [
+        _make_para(title, title_style),
+        Spacer(1, 0.5*inch),
+        *(_make_para(para, body_style) for para in _split_paragraphs(content)),
+    ]
     
-    story = []
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 0.5*inch))
-    
-    # Split content into paragraphs and add them
-    paragraphs = content.strip().split('<br/><br/>')
-    for para in paragraphs:
-        para = para.replace('<br/>', '<br/>')
-        story.append(Paragraph(para, body_style))
-    
+    buffer = io.BytesIO()
+    # Compressed page streams keep the checked-in fixtures small, and
+    # invariant output (no timestamps or random IDs) keeps them
+    # byte-identical across regenerations.
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                           topMargin=1*inch, bottomMargin=1*inch,
+                           leftMargin=1*inch, rightMargin=1*inch,
+                           pageCompression=1, invariant=1)
     doc.build(story)
-    print(f"Created: {filepath}")
+    return buffer.getvalue()
+
+
+def _is_current(filepath: str, data: bytes) -> bool:
+    """Return True if filepath already holds exactly these bytes."""
+    try:
+        if os.stat(filepath).st_size != len(data):
+            return False
+        with open(filepath, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def write_pdfs(outputs: Iterable[tuple[str, bytes]]) -> int:
+    """Write rendered PDFs to disk, one unbuffered write() per file.
+
+    Rendering is deterministic (invariant=1), so a PDF whose bytes already
+    match is left untouched. Returns the number of files written.
+    """
+    written = 0
+    for filepath, data in outputs:
+        if _is_current(filepath, data):
+            print(f"Unchanged: {filepath}")
+            continue
+        with open(filepath, "wb", buffering=0) as f:
+            view = memoryview(data)
+            while view:
+                view = view[f.write(view):]
+        print(f"Created: {filepath}")
+        written += 1
+    return written
+
+
+def create_pdf(filename: str, title: str, content: str, output_dir: str | None = None) -> str:
+    """Create a PDF document and return its path."""
+    filepath = os.path.join(output_dir or OUTPUT_DIR, filename)
+    write_pdfs([(filepath, render_pdf(title, content))])
+    return filepath
+
+
+def _render_document(item: tuple[str, str, str, str]) -> tuple[str, bytes]:
+    """Process-pool entry point: render one document, return (path, bytes)."""
+    filename, title, content, output_dir = item
+    return os.path.join(output_dir, filename), render_pdf(title, content)
 
 
 def main():
@@ -749,10 +883,19 @@ def main():
     
     print(f"\nGenerating {len(DOCUMENTS)} test documents in {OUTPUT_DIR}/\n")
     
-    for filename, doc_info in DOCUMENTS.items():
-        create_pdf(filename, doc_info["title"], doc_info["content"])
+    # Documents are independent and rendering is CPU-bound, so build them
+    # in parallel. OUTPUT_DIR is passed explicitly so spawn platforms
+    # (macOS/Windows) behave the same as fork.
+    jobs = [(filename, title, content, OUTPUT_DIR) for filename, title, content in DOCUMENTS]
+    # Workers only render; this process writes each result as it arrives,
+    # so writes overlap with the documents still rendering.
+    with ProcessPoolExecutor() as executor:
+        written = write_pdfs(executor.map(_render_document, jobs))
     
-    print(f"\n✅ Generated {len(DOCUMENTS)} documents successfully!")
+    print(
+        f"\n✅ Wrote {written} documents "
+        f"({len(DOCUMENTS) - written} already up to date)."
+    )
     print(f"\nDocument cross-reference map:")
     print("=" * 60)
     print("""
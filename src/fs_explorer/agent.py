@@ -5,15 +5,14 @@ This module contains the agent that interacts with the Gemini AI model
 to make decisions about filesystem exploration actions.
 """
 
+import asyncio
+import functools
 import os
-import re
 from pathlib import Path
-from typing import Callable, Any, cast
+from typing import TYPE_CHECKING, Callable, Any, cast
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
-from google.genai.types import Content, HttpOptions, Part
-from google.genai import Client as GenAIClient
 
 from .models import Action, ActionType, ToolCallAction, Tools
 from .fs import (
@@ -33,10 +32,20 @@ from .search import (
 )
 from .storage import DuckDBStorage
 
-# Load .env file from project root
-_env_path = Path(__file__).parent.parent.parent / ".env"
-if _env_path.exists():
-    load_dotenv(_env_path)
+# google.genai is a heavy import; it is only loaded once an agent is
+# actually created, so indexed tools and the CLI can run without it.
+if TYPE_CHECKING:
+    from google.genai.types import Content
+
+# Load .env file from project root. The marker is inherited by child
+# processes, so workers spawned from an already-configured process skip
+# re-reading the file.
+_ENV_LOADED_MARKER = "FS_EXPLORER_ENV_LOADED"
+if not os.getenv(_ENV_LOADED_MARKER):
+    _env_path = Path(__file__).parent.parent.parent / ".env"
+    if _env_path.exists():
+        load_dotenv(_env_path)
+    os.environ[_ENV_LOADED_MARKER] = "1"
 
 
 # =============================================================================
@@ -47,8 +56,32 @@ if _env_path.exists():
 GEMINI_FLASH_INPUT_COST_PER_MILLION = 0.075
 GEMINI_FLASH_OUTPUT_COST_PER_MILLION = 0.30
 
+# Per-token rates, so cost estimation is a multiply rather than a divide.
+_INPUT_COST_PER_TOKEN = GEMINI_FLASH_INPUT_COST_PER_MILLION / 1_000_000
+_OUTPUT_COST_PER_TOKEN = GEMINI_FLASH_OUTPUT_COST_PER_MILLION / 1_000_000
 
-@dataclass
+_SUMMARY_TEMPLATE = """
+═══════════════════════════════════════════════════════════════
+                      TOKEN USAGE SUMMARY
+═══════════════════════════════════════════════════════════════
+  API Calls:           {api_calls}
+  Prompt Tokens:       {prompt_tokens:,}
+  Completion Tokens:   {completion_tokens:,}
+  Total Tokens:        {total_tokens:,}
+───────────────────────────────────────────────────────────────
+  Documents Scanned:   {documents_scanned}
+  Documents Parsed:    {documents_parsed}
+  Tool Result Chars:   {tool_result_chars:,}
+───────────────────────────────────────────────────────────────
+  Est. Cost (Gemini Flash):
+    Input:  ${input_cost:.4f}
+    Output: ${output_cost:.4f}
+    Total:  ${total_cost:.4f}
+═══════════════════════════════════════════════════════════════
+"""
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """
     Track token usage and costs across the session.
@@ -77,47 +110,47 @@ class TokenUsage:
     def add_tool_result(self, result: str, tool_name: str) -> None:
         """Record metrics from a tool execution."""
         self.tool_result_chars += len(result)
-        if tool_name == "parse_file":
-            self.documents_parsed += 1
-        elif tool_name == "scan_folder":
-            # Count documents in scan result by counting document markers
-            self.documents_scanned += result.count("│ [")
-        elif tool_name == "preview_file":
-            self.documents_parsed += 1
+        handler = _TOOL_METRIC_HANDLERS.get(tool_name)
+        if handler is not None:
+            handler(self, result)
 
     def _calculate_cost(self) -> tuple[float, float, float]:
         """Calculate estimated costs based on Gemini Flash pricing."""
-        input_cost = (
-            self.prompt_tokens / 1_000_000
-        ) * GEMINI_FLASH_INPUT_COST_PER_MILLION
-        output_cost = (
-            self.completion_tokens / 1_000_000
-        ) * GEMINI_FLASH_OUTPUT_COST_PER_MILLION
+        input_cost = self.prompt_tokens * _INPUT_COST_PER_TOKEN
+        output_cost = self.completion_tokens * _OUTPUT_COST_PER_TOKEN
         return input_cost, output_cost, input_cost + output_cost
 
     def summary(self) -> str:
         """Generate a formatted summary of token usage and costs."""
         input_cost, output_cost, total_cost = self._calculate_cost()
+        return _SUMMARY_TEMPLATE.format(
+            api_calls=self.api_calls,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_tokens=self.total_tokens,
+            documents_scanned=self.documents_scanned,
+            documents_parsed=self.documents_parsed,
+            tool_result_chars=self.tool_result_chars,
+            input_cost=input_cost,
+            output_cost=output_cost,
+            total_cost=total_cost,
+        )
+
+
+def _record_parsed_document(usage: TokenUsage, result: str) -> None:
+    usage.documents_parsed += 1
 
-        return f"""
-═══════════════════════════════════════════════════════════════
-                      TOKEN USAGE SUMMARY
-═══════════════════════════════════════════════════════════════
-  API Calls:           {self.api_calls}
-  Prompt Tokens:       {self.prompt_tokens:,}
-  Completion Tokens:   {self.completion_tokens:,}
-  Total Tokens:        {self.total_tokens:,}
-───────────────────────────────────────────────────────────────
-  Documents Scanned:   {self.documents_scanned}
-  Documents Parsed:    {self.documents_parsed}
-  Tool Result Chars:   {self.tool_result_chars:,}
-───────────────────────────────────────────────────────────────
-  Est. Cost (Gemini Flash):
-    Input:  ${input_cost:.4f}
-    Output: ${output_cost:.4f}
-    Total:  ${total_cost:.4f}
-═══════════════════════════════════════════════════════════════
-"""
+
+def _record_scanned_documents(usage: TokenUsage, result: str) -> None:
+    # Count documents in scan result by counting document markers
+    usage.documents_scanned += result.count("│ [")
+
+
+_TOOL_METRIC_HANDLERS: dict[str, Callable[[TokenUsage, str], None]] = {
+    "parse_file": _record_parsed_document,
+    "scan_folder": _record_scanned_documents,
+    "preview_file": _record_parsed_document,
+}
 
 
 # =============================================================================
@@ -125,15 +158,19 @@ class TokenUsage:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class IndexContext:
     """Execution context for indexed retrieval tools."""
 
     root_folder: str
     db_path: str
+    # Resolved on first successful lookup; a corpus id never changes
+    # for the lifetime of a context.
+    corpus_id: str | None = None
 
 
 _INDEX_CONTEXT: IndexContext | None = None
+_INDEX_STORAGE: DuckDBStorage | None = None
 _EMBEDDING_PROVIDER: EmbeddingProvider | None = None
 _FIELD_CATALOG_SHOWN: bool = False
 _ENABLE_SEMANTIC: bool = False
@@ -163,6 +200,7 @@ def set_embedding_provider(provider: EmbeddingProvider | None) -> None:
 def set_index_context(folder: str, db_path: str | None = None) -> None:
     """Enable indexed tools for a specific folder corpus."""
     global _INDEX_CONTEXT, _EMBEDDING_PROVIDER
+    _close_index_storage()
     _INDEX_CONTEXT = IndexContext(
         root_folder=str(Path(folder).resolve()),
         db_path=resolve_db_path(db_path),
@@ -179,6 +217,7 @@ def clear_index_context() -> None:
     """Disable indexed tools for the current process."""
     global _INDEX_CONTEXT, _EMBEDDING_PROVIDER, _FIELD_CATALOG_SHOWN
     global _ENABLE_SEMANTIC, _ENABLE_METADATA
+    _close_index_storage()
     _INDEX_CONTEXT = None
     _EMBEDDING_PROVIDER = None
     _FIELD_CATALOG_SHOWN = False
@@ -186,26 +225,42 @@ def clear_index_context() -> None:
     _ENABLE_METADATA = False
 
 
+def _close_index_storage() -> None:
+    """Close the shared index connection, if one has been opened."""
+    global _INDEX_STORAGE
+    if _INDEX_STORAGE is not None:
+        _INDEX_STORAGE.close()
+        _INDEX_STORAGE = None
+
+
 def _get_index_storage_and_corpus() -> tuple[
     DuckDBStorage | None, str | None, str | None
 ]:
+    global _INDEX_STORAGE
     if _INDEX_CONTEXT is None:
         return None, None, "Index context is not configured. Re-run with `--use-index`."
 
-    storage = DuckDBStorage(_INDEX_CONTEXT.db_path)
-    corpus_id = storage.get_corpus_id(_INDEX_CONTEXT.root_folder)
-    if corpus_id is None:
-        return (
-            None,
-            None,
-            f"No index found for folder {_INDEX_CONTEXT.root_folder}. "
-            "Run `explore index <folder>` first.",
-        )
-    return storage, corpus_id, None
+    # Open the index once per context and reuse it across tool calls,
+    # rather than paying a DuckDB connect (and catalog load) every step.
+    if _INDEX_STORAGE is None:
+        _INDEX_STORAGE = DuckDBStorage(_INDEX_CONTEXT.db_path)
+    storage = _INDEX_STORAGE
+    if _INDEX_CONTEXT.corpus_id is None:
+        corpus_id = storage.get_corpus_id(_INDEX_CONTEXT.root_folder)
+        if corpus_id is None:
+            return (
+                None,
+                None,
+                f"No index found for folder {_INDEX_CONTEXT.root_folder}. "
+                "Run `explore index <folder>` first.",
+            )
+        _INDEX_CONTEXT.corpus_id = corpus_id
+    return storage, _INDEX_CONTEXT.corpus_id, None
 
 
 def _clean_excerpt(text: str, max_chars: int = 320) -> str:
-    squashed = re.sub(r"\s+", " ", text).strip()
+    # str.split() collapses runs of whitespace (same set as \s) in C.
+    squashed = " ".join(text.split())
     if len(squashed) <= max_chars:
         return squashed
     return f"{squashed[:max_chars]}..."
@@ -247,18 +302,17 @@ def semantic_search(query: str, filters: str | None = None, limit: int = 5) -> s
     lines.append("")
     for idx, hit in enumerate(hits, start=1):
         position = hit.position if hit.position is not None else "<metadata>"
-        lines.extend(
-            [
-                f"[{idx}] doc_id: {hit.doc_id}",
-                f"    path: {hit.absolute_path}",
-                f"    match: {hit.matched_by}",
-                f"    chunk_position: {position}",
-                f"    semantic_score: {hit.semantic_score}",
-                f"    metadata_score: {hit.metadata_score}",
-                f"    score: {hit.score:.2f}",
-                f"    excerpt: {_clean_excerpt(hit.text)}",
-                "",
-            ]
+        # One pre-joined block per hit; the trailing newline leaves the
+        # blank separator line once the outer join runs.
+        lines.append(
+            f"[{idx}] doc_id: {hit.doc_id}\n"
+            f"    path: {hit.absolute_path}\n"
+            f"    match: {hit.matched_by}\n"
+            f"    chunk_position: {position}\n"
+            f"    semantic_score: {hit.semantic_score}\n"
+            f"    metadata_score: {hit.metadata_score}\n"
+            f"    score: {hit.score:.2f}\n"
+            f"    excerpt: {_clean_excerpt(hit.text)}\n"
         )
     lines.append(
         "Use get_document(doc_id=...) to read full content for the most relevant documents."
@@ -332,11 +386,16 @@ def get_document(doc_id: str) -> str:
         return error
     assert storage is not None
 
+    # Check existence and deletion without pulling the content column.
+    meta = storage.get_document_meta(doc_id=doc_id)
+    if meta is None:
+        return f"No indexed document found for doc_id={doc_id!r}"
+    if meta["is_deleted"]:
+        return f"Document {doc_id} is marked as deleted in the index."
+
     document = storage.get_document(doc_id=doc_id)
     if document is None:
         return f"No indexed document found for doc_id={doc_id!r}"
-    if document["is_deleted"]:
-        return f"Document {doc_id} is marked as deleted in the index."
 
     return (
         f"=== DOCUMENT {doc_id} ===\n"
@@ -378,6 +437,43 @@ TOOLS: dict[Tools, Callable[..., str]] = {
     "list_indexed_documents": list_indexed_documents,
 }
 
+_TOOL_NAMES: frozenset[str] = frozenset(TOOLS)
+
+# Filesystem tools do blocking disk I/O and document parsing, so the agent
+# runs them on a worker thread to keep the event loop responsive. Indexed
+# tools stay on the loop thread because they share one DuckDB connection.
+_BLOCKING_TOOLS: frozenset[str] = frozenset(
+    {"read", "grep", "glob", "scan_folder", "preview_file", "parse_file"}
+)
+
+# Per-tool cap on how much of an older tool result stays in the chat history.
+# Tools not listed here (short, structured output) are never trimmed.
+_MAX_HISTORY_CHARS: dict[str, int] = {
+    "parse_file": 8000,
+    "get_document": 8000,
+    "read": 8000,
+    "preview_file": 4000,
+    "scan_folder": 4000,
+}
+
+
+def _truncate_for_history(
+    tool_name: str, tool_input: dict[str, Any], result: str
+) -> str:
+    """Cap a tool result for long-term history; returns result unchanged if short.
+
+    The marker names the exact call to repeat, so the model can get the full
+    text back on demand (parsed documents are served from the fs cache).
+    """
+    limit = _MAX_HISTORY_CHARS.get(tool_name)
+    if limit is None or len(result) <= limit:
+        return result
+    args = ", ".join(f"{name}={value!r}" for name, value in tool_input.items())
+    return (
+        f"{result[:limit]}\n...[truncated, {len(result) - limit} chars omitted; "
+        f"call {tool_name}({args}) again to see the full result]"
+    )
+
 
 # =============================================================================
 # System Prompt
@@ -533,6 +629,59 @@ def _build_system_prompt(enable_semantic: bool, enable_metadata: bool) -> str:
     return SYSTEM_PROMPT + hint
 
 
+@functools.lru_cache(maxsize=None)
+def _generation_config(enable_semantic: bool, enable_metadata: bool) -> Any:
+    """
+    Build the request config for a flag combination, once per process.
+
+    The Action schema is generated here rather than passed as
+    ``response_schema=Action``: the SDK would otherwise rebuild it from the
+    model on every request. ``response_json_schema`` is sent as-is.
+    """
+    from google.genai.types import GenerateContentConfig
+
+    return GenerateContentConfig(
+        system_instruction=_build_system_prompt(enable_semantic, enable_metadata),
+        response_mime_type="application/json",
+        response_json_schema=Action.model_json_schema(),
+    )
+
+
+def _parse_action(response: Any) -> Action | None:
+    """
+    Extract the structured Action from a generate_content response.
+
+    The SDK already decodes the JSON and exposes the result as
+    ``response.parsed``; reading the raw JSON again is only needed when
+    that is missing. In that case a single text
+    part is validated directly instead of going through ``response.text``,
+    which joins every part into a new string first.
+    """
+    parsed = getattr(response, "parsed", None)
+    if isinstance(parsed, Action):
+        return parsed
+    if isinstance(parsed, dict):
+        return Action.model_validate(parsed)
+    raw = _single_text_part(response)
+    if raw is None:
+        raw = response.text
+    if raw is not None:
+        return Action.__pydantic_validator__.validate_json(raw)
+    return None
+
+
+def _single_text_part(response: Any) -> str | None:
+    """Return the text of the first candidate when it has exactly one part."""
+    candidates = getattr(response, "candidates", None)
+    if not candidates:
+        return None
+    content = candidates[0].content
+    parts = content.parts if content is not None else None
+    if not parts or len(parts) != 1:
+        return None
+    return parts[0].text
+
+
 # =============================================================================
 # Agent Implementation
 # =============================================================================
@@ -568,11 +717,19 @@ class FsExplorerAgent:
                 "please export it or provide it to the class constructor."
             )
 
+        from google.genai import Client as GenAIClient
+        from google.genai.types import HttpOptions
+
         self._client = GenAIClient(
             api_key=api_key,
             http_options=HttpOptions(api_version="v1beta"),
         )
         self._chat_history: list[Content] = []
+        # (history index, tool name, tool input, full result) of the newest
+        # tool result, which is shrunk once the model has had one turn to read it.
+        self._last_tool_result: (
+            tuple[int, Tools, dict[str, Any], str] | None
+        ) = None
         self.token_usage = TokenUsage()
 
     def configure_task(self, task: str) -> None:
@@ -582,6 +739,8 @@ class FsExplorerAgent:
         Args:
             task: The task or context to add to the conversation.
         """
+        from google.genai.types import Content, Part
+
         self._chat_history.append(
             Content(role="user", parts=[Part.from_text(text=task)])
         )
@@ -599,11 +758,7 @@ class FsExplorerAgent:
         response = await self._client.aio.models.generate_content(
             model="gemini-3-flash-preview",
             contents=self._chat_history,  # type: ignore
-            config={
-                "system_instruction": _build_system_prompt(_ENABLE_SEMANTIC, _ENABLE_METADATA),
-                "response_mime_type": "application/json",
-                "response_schema": Action,
-            },
+            config=_generation_config(_ENABLE_SEMANTIC, _ENABLE_METADATA),
         )
 
         # Track token usage from response metadata
@@ -616,14 +771,21 @@ class FsExplorerAgent:
         if response.candidates is not None:
             if response.candidates[0].content is not None:
                 self._chat_history.append(response.candidates[0].content)
-            if response.text is not None:
-                action = Action.model_validate_json(response.text)
+            action = _parse_action(response)
+            if action is not None:
                 if action.to_action_type() == "toolcall":
                     toolcall = cast(ToolCallAction, action.action)
-                    self.call_tool(
-                        tool_name=toolcall.tool_name,
-                        tool_input=toolcall.to_fn_args(),
-                    )
+                    if toolcall.tool_name in _BLOCKING_TOOLS:
+                        await asyncio.to_thread(
+                            self.call_tool,
+                            tool_name=toolcall.tool_name,
+                            tool_input=toolcall.to_fn_args(),
+                        )
+                    else:
+                        self.call_tool(
+                            tool_name=toolcall.tool_name,
+                            tool_input=toolcall.to_fn_args(),
+                        )
                 return action, action.to_action_type()
 
         return None
@@ -636,17 +798,45 @@ class FsExplorerAgent:
             tool_name: Name of the tool to execute.
             tool_input: Dictionary of arguments to pass to the tool.
         """
-        try:
-            result = TOOLS[tool_name](**tool_input)
-        except Exception as e:
+        if tool_name not in _TOOL_NAMES:
             result = (
-                f"An error occurred while calling tool {tool_name} "
-                f"with {tool_input}: {e}"
+                f"Unknown tool {tool_name!r}. "
+                f"Available: {sorted(_TOOL_NAMES)}"
             )
+        else:
+            try:
+                result = TOOLS[tool_name](**tool_input)
+            except Exception as e:
+                result = (
+                    f"An error occurred while calling tool {tool_name} "
+                    f"with {tool_input}: {e}"
+                )
 
-        # Track tool result sizes
+        # Track tool result sizes (always the full, untruncated result)
         self.token_usage.add_tool_result(result, tool_name)
 
+        from google.genai.types import Content, Part
+
+        # The whole history is re-sent every turn, so large results from
+        # earlier steps would be paid for again and again. The model sees
+        # each result in full on the turn right after the call; after that
+        # only a capped prefix is kept.
+        if self._last_tool_result is not None:
+            index, last_tool, last_input, last_result = self._last_tool_result
+            trimmed = _truncate_for_history(last_tool, last_input, last_result)
+            if trimmed is not last_result:
+                self._chat_history[index] = Content(
+                    role="user",
+                    parts=[
+                        Part.from_text(
+                            text=f"Tool result for {last_tool}:\n\n{trimmed}"
+                        )
+                    ],
+                )
+
+        self._last_tool_result = (
+            len(self._chat_history), tool_name, tool_input, result
+        )
         self._chat_history.append(
             Content(
                 role="user",
@@ -659,4 +849,5 @@ class FsExplorerAgent:
     def reset(self) -> None:
         """Reset the agent's conversation history and token tracking."""
         self._chat_history.clear()
+        self._last_tool_result = None
         self.token_usage = TokenUsage()
@@ -8,14 +8,17 @@ with configurable model, dimensions, and batch size.
 from __future__ import annotations
 
 import os
-from typing import Any
-
-from google.genai import Client as GenAIClient
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
 
 
 _DEFAULT_MODEL = "gemini-embedding-001"
 _DEFAULT_DIM = 768
-_DEFAULT_BATCH_SIZE = 50
+_DEFAULT_BATCH_SIZE = 100  # Gemini batchEmbedContents request limit
+_DEFAULT_MAX_CONCURRENCY = 4
+_DEFAULT_CACHE_SIZE = 1024
 
 
 class EmbeddingProvider:
@@ -28,13 +31,31 @@ class EmbeddingProvider:
         model: str | None = None,
         dim: int | None = None,
         batch_size: int | None = None,
+        max_concurrency: int | None = None,
         client: Any | None = None,
+        cache_size: int | None = None,
     ) -> None:
         self.model = model or os.getenv("FS_EXPLORER_EMBEDDING_MODEL", _DEFAULT_MODEL)
         self.dim = dim or int(os.getenv("FS_EXPLORER_EMBEDDING_DIM", str(_DEFAULT_DIM)))
         self.batch_size = batch_size or int(
             os.getenv("FS_EXPLORER_EMBEDDING_BATCH_SIZE", str(_DEFAULT_BATCH_SIZE))
         )
+        self.max_concurrency = max_concurrency or int(
+            os.getenv(
+                "FS_EXPLORER_EMBEDDING_CONCURRENCY", str(_DEFAULT_MAX_CONCURRENCY)
+            )
+        )
+        self.cache_size = (
+            cache_size
+            if cache_size is not None
+            else int(os.getenv("FS_EXPLORER_EMBED_CACHE", str(_DEFAULT_CACHE_SIZE)))
+        )
+        # Exact-match LRU keyed by (task_type, text); model and dim are fixed
+        # per provider, so they do not need to be part of the key. Vectors
+        # are stored as tuples and handed out as new lists, so callers cannot
+        # change what is cached. The lock covers providers shared by threads.
+        self._cache: OrderedDict[tuple[str, str], tuple[float, ...]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         if client is not None:
             self._client = client
@@ -45,8 +66,77 @@ class EmbeddingProvider:
                     "GOOGLE_API_KEY not found. "
                     "Provide api_key or set the environment variable."
                 )
+            from google.genai import Client as GenAIClient
+
             self._client = GenAIClient(api_key=resolved_key)
 
+    def _cache_get(self, task_type: str, text: str) -> list[float] | None:
+        with self._cache_lock:
+            vector = self._cache.get((task_type, text))
+            if vector is None:
+                return None
+            self._cache.move_to_end((task_type, text))
+        return list(vector)
+
+    def _cache_put(self, task_type: str, text: str, vector: list[float]) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[(task_type, text)] = tuple(vector)
+            self._cache.move_to_end((task_type, text))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _embed_one_batch(self, batch: list[str], task_type: str) -> list[list[float]]:
+        result = self._client.models.embed_content(
+            model=self.model,
+            contents=batch,
+            config={
+                "task_type": task_type,
+                "output_dimensionality": self.dim,
+            },
+        )
+        vectors: list[list[float]] = []
+        for emb in result.embeddings:
+            if emb.values is None:
+                raise ValueError(
+                    f"Embedding API returned no values for model {self.model}"
+                )
+            vectors.append(emb.values)
+        if len(vectors) != len(batch):
+            raise ValueError(
+                f"Embedding API returned {len(vectors)} vectors "
+                f"for {len(batch)} texts"
+            )
+        return vectors
+
+    def _embed_batch(self, texts: list[str], task_type: str) -> list[list[float]]:
+        """Call the embedding API for *texts*, chunked by ``batch_size``.
+
+        Batches are sent concurrently (up to ``max_concurrency`` requests in
+        flight); results are returned in input order.
+        """
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        workers = min(self.max_concurrency, len(batches))
+        if workers <= 1:
+            results = [self._embed_one_batch(batch, task_type) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda batch: self._embed_one_batch(batch, task_type),
+                        batches,
+                    )
+                )
+
+        embeddings: list[list[float]] = []
+        for batch_embeddings in results:
+            embeddings.extend(batch_embeddings)
+        return embeddings
+
     def embed_texts(
         self,
         texts: list[str],
@@ -55,31 +145,32 @@ class EmbeddingProvider:
     ) -> list[list[float]]:
         """Embed a list of texts in batches.
 
+        Texts already in the cache are not sent to the API again, and
+        repeated texts within *texts* are embedded once.
         Returns a list of embedding vectors in the same order as *texts*.
         """
-        all_embeddings: list[list[float]] = []
-        for start in range(0, len(texts), self.batch_size):
-            batch = texts[start : start + self.batch_size]
-            result = self._client.models.embed_content(
-                model=self.model,
-                contents=batch,
-                config={
-                    "task_type": task_type,
-                    "output_dimensionality": self.dim,
-                },
-            )
-            for emb in result.embeddings:
-                all_embeddings.append(list(emb.values))
-        return all_embeddings
+        all_embeddings: list[list[float] | None] = [
+            self._cache_get(task_type, text) for text in texts
+        ]
+        # Uncached text -> positions in *texts* where it occurs.
+        missing: dict[str, list[int]] = {}
+        for i, vector in enumerate(all_embeddings):
+            if vector is None:
+                missing.setdefault(texts[i], []).append(i)
+        if missing:
+            fresh = self._embed_batch(list(missing), task_type)
+            for (text, positions), vector in zip(missing.items(), fresh, strict=True):
+                all_embeddings[positions[0]] = vector
+                for i in positions[1:]:
+                    all_embeddings[i] = list(vector)
+                self._cache_put(task_type, text, vector)
+        return cast("list[list[float]]", all_embeddings)
 
     def embed_query(self, query: str) -> list[float]:
         """Embed a single query text for retrieval."""
-        result = self._client.models.embed_content(
-            model=self.model,
-            contents=[query],
-            config={
-                "task_type": "RETRIEVAL_QUERY",
-                "output_dimensionality": self.dim,
-            },
-        )
-        return list(result.embeddings[0].values)
+        cached = self._cache_get("RETRIEVAL_QUERY", query)
+        if cached is not None:
+            return cached
+        vector = self._embed_batch([query], "RETRIEVAL_QUERY")[0]
+        self._cache_put("RETRIEVAL_QUERY", query, vector)
+        return vector
@@ -28,16 +28,14 @@ def extract_cited_sources(final_result: str | None) -> list[str]:
     if not final_result:
         return []
 
-    seen: set[str] = set()
-    ordered_sources: list[str] = []
+    # dict keys keep first-seen order, so one mapping does the dedup.
+    ordered_sources: dict[str, None] = {}
+    for match in SOURCE_CITATION_RE.finditer(final_result):
+        source = match.group(1).strip()
+        if source:
+            ordered_sources.setdefault(source, None)
 
-    for raw_source in SOURCE_CITATION_RE.findall(final_result):
-        source = raw_source.strip()
-        if source and source not in seen:
-            seen.add(source)
-            ordered_sources.append(source)
-
-    return ordered_sources
+    return list(ordered_sources)
 
 
 @dataclass
@@ -51,6 +49,18 @@ class ExplorationTrace:
     root_directory: str
     step_path: list[str] = field(default_factory=list)
     referenced_documents: set[str] = field(default_factory=set)
+    _root_abs: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Resolve the root once; relative inputs are then joined onto it
+        # without another getcwd() per recorded path.
+        self._root_abs = os.path.abspath(self.root_directory)
+
+    def _normalize(self, path: str) -> str:
+        """Same result as ``normalize_path(path, self.root_directory)``."""
+        if os.path.isabs(path):
+            return os.path.normpath(path)
+        return os.path.normpath(os.path.join(self._root_abs, path))
 
     def record_tool_call(
         self,
@@ -65,17 +75,17 @@ class ExplorationTrace:
 
         directory = tool_input.get("directory")
         if isinstance(directory, str) and directory:
-            path_entries.append(f"directory={normalize_path(directory, self.root_directory)}")
+            path_entries.append(f"directory={self._normalize(directory)}")
 
         file_path = tool_input.get("file_path")
         if isinstance(file_path, str) and file_path:
-            normalized_file_path = normalize_path(file_path, self.root_directory)
+            normalized_file_path = self._normalize(file_path)
             path_entries.append(f"file={normalized_file_path}")
             if tool_name in FILE_TOOLS:
                 self.referenced_documents.add(normalized_file_path)
 
         if resolved_document_path:
-            normalized_doc_path = normalize_path(resolved_document_path, self.root_directory)
+            normalized_doc_path = self._normalize(resolved_document_path)
             path_entries.append(f"document={normalized_doc_path}")
             self.referenced_documents.add(normalized_doc_path)
 
@@ -84,7 +94,7 @@ class ExplorationTrace:
 
     def record_go_deeper(self, *, step_number: int, directory: str) -> None:
         """Record a directory navigation event in the exploration path."""
-        resolved_dir = normalize_path(directory, self.root_directory)
+        resolved_dir = self._normalize(directory)
         self.step_path.append(f"{step_number}. godeeper (directory={resolved_dir})")
 
     def sorted_documents(self) -> list[str]:
@@ -5,11 +5,21 @@ This module provides functions for reading, searching, and parsing files
 in the filesystem, including support for complex document formats via Docling.
 """
 
+import atexit
+import fnmatch
+import functools
 import os
 import re
+import stat
 import glob as glob_module
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Callable
 
 from docling.document_converter import DocumentConverter
 
@@ -29,30 +39,122 @@ DEFAULT_SCAN_PREVIEW_CHARS = 1500  # Characters for folder scan preview (~1 page
 MAX_PREVIEW_LINES = 30  # Maximum lines to show in scan results
 
 # Parallel processing settings
-DEFAULT_MAX_WORKERS = 4  # Thread pool size for parallel document scanning
+DEFAULT_MAX_WORKERS = 4  # Process pool size for parallel document scanning
+
+# Plain-text read settings
+MAX_READ_BYTES = 2_000_000  # Cap for read_file so huge files can't exhaust memory
 
 
 # =============================================================================
 # Document Cache
 # =============================================================================
 
-# Cache for parsed documents to avoid re-parsing
-_DOCUMENT_CACHE: dict[str, str] = {}
+# Cache for parsed documents to avoid re-parsing, bounded by both entry count
+# and total characters; least recently used entries are evicted first.
+DOCUMENT_CACHE_MAX_ENTRIES = 256
+DOCUMENT_CACHE_MAX_CHARS = 64_000_000
+
+# Keyed by (st_dev, st_ino, st_size, st_mtime_ns), so an edited or replaced
+# file misses the cache.
+_DOCUMENT_CACHE: OrderedDict[tuple[int, int, int, int], str] = OrderedDict()
+_DOCUMENT_CACHE_CHARS = 0
+# Tools run on worker threads (asyncio.to_thread), possibly several at once.
+_DOCUMENT_CACHE_LOCK = threading.Lock()
 
 
 def clear_document_cache() -> None:
     """Clear the document cache. Useful for testing or memory management."""
-    _DOCUMENT_CACHE.clear()
+    global _DOCUMENT_CACHE_CHARS
+    with _DOCUMENT_CACHE_LOCK:
+        _DOCUMENT_CACHE.clear()
+        _DOCUMENT_CACHE_CHARS = 0
+
+
+def _stat_file(file_path: str) -> os.stat_result | None:
+    """Stat a path once; returns None unless it is an existing regular file."""
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _document_cache_key(
+    file_path: str, st: os.stat_result | None = None
+) -> tuple[int, int, int, int]:
+    if st is None:
+        st = os.stat(file_path)
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _cache_lookup(cache_key: tuple[int, int, int, int]) -> str | None:
+    with _DOCUMENT_CACHE_LOCK:
+        cached = _DOCUMENT_CACHE.get(cache_key)
+        if cached is not None:
+            _DOCUMENT_CACHE.move_to_end(cache_key)
+        return cached
+
+
+def _cache_store(cache_key: tuple[int, int, int, int], markdown: str) -> None:
+    global _DOCUMENT_CACHE_CHARS
+    with _DOCUMENT_CACHE_LOCK:
+        previous = _DOCUMENT_CACHE.pop(cache_key, None)
+        if previous is not None:
+            _DOCUMENT_CACHE_CHARS -= len(previous)
+        _DOCUMENT_CACHE[cache_key] = markdown
+        _DOCUMENT_CACHE_CHARS += len(markdown)
+        while len(_DOCUMENT_CACHE) > 1 and (
+            len(_DOCUMENT_CACHE) > DOCUMENT_CACHE_MAX_ENTRIES
+            or _DOCUMENT_CACHE_CHARS > DOCUMENT_CACHE_MAX_CHARS
+        ):
+            _, evicted = _DOCUMENT_CACHE.popitem(last=False)
+            _DOCUMENT_CACHE_CHARS -= len(evicted)
+
+
+# Docling loads its layout/table/OCR models into the converter's pipelines,
+# so one converter is kept per process (including each scan_folder worker)
+# and those models are loaded once rather than on every parse.
+_CONVERTER: DocumentConverter | None = None
+
+
+def _get_converter() -> DocumentConverter:
+    global _CONVERTER
+    if _CONVERTER is None:
+        _CONVERTER = DocumentConverter()
+    return _CONVERTER
+
+
+def _read_markdown(file_path: str) -> str:
+    """Markdown is already the target format; return it as-is."""
+    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
 
 
-def _get_cached_or_parse(file_path: str) -> str:
+# Formats that don't need Docling at all, keyed by lowercase extension.
+_FAST_PARSERS: dict[str, Callable[[str], str]] = {
+    ".md": _read_markdown,
+}
+
+
+def _parse_document(file_path: str) -> str:
+    """Convert a document to markdown (no caching)."""
+    fast_parser = _FAST_PARSERS.get(os.path.splitext(file_path)[1].lower())
+    if fast_parser is not None:
+        return fast_parser(file_path)
+    result = _get_converter().convert(file_path)
+    return result.document.export_to_markdown()
+
+
+def _get_cached_or_parse(file_path: str, st: os.stat_result | None = None) -> str:
     """
     Get document content from cache or parse it.
     
-    Uses file modification time in cache key to invalidate stale entries.
+    Uses the file's identity, size and modification time in the cache key
+    to invalidate stale entries.
     
     Args:
         file_path: Path to the document file.
+        st: The file's stat result, if the caller already has it.
     
     Returns:
         The document content as markdown.
@@ -60,15 +162,14 @@ def _get_cached_or_parse(file_path: str) -> str:
     Raises:
         Exception: If the document cannot be parsed.
     """
-    abs_path = os.path.abspath(file_path)
-    cache_key = f"{abs_path}:{os.path.getmtime(abs_path)}"
-    
-    if cache_key not in _DOCUMENT_CACHE:
-        converter = DocumentConverter()
-        result = converter.convert(file_path)
-        _DOCUMENT_CACHE[cache_key] = result.document.export_to_markdown()
+    cache_key = _document_cache_key(file_path, st)
+    cached = _cache_lookup(cache_key)
+    if cached is not None:
+        return cached
     
-    return _DOCUMENT_CACHE[cache_key]
+    markdown = _parse_document(file_path)
+    _cache_store(cache_key, markdown)
+    return markdown
 
 
 # =============================================================================
@@ -88,22 +189,21 @@ def describe_dir_content(directory: str) -> str:
         A formatted string describing the directory contents,
         or an error message if the directory doesn't exist.
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    if not os.path.isdir(directory):
         return f"No such directory: {directory}"
     
-    children = os.listdir(directory)
+    with os.scandir(directory) as it:
+        children = list(it)
     if not children:
         return f"Directory {directory} is empty"
     
     files = []
     directories = []
     
+    # DirEntry.is_file() uses the type from the directory listing,
+    # avoiding a stat per child on most platforms.
     for child in children:
-        fullpath = os.path.join(directory, child)
-        if os.path.isfile(fullpath):
-            files.append(fullpath)
-        else:
-            directories.append(fullpath)
+        (files if child.is_file() else directories).append(child.path)
     
     description = f"Content of {directory}\n"
     description += "FILES:\n- " + "\n- ".join(files)
@@ -130,11 +230,46 @@ def read_file(file_path: str) -> str:
     Returns:
         The file contents, or an error message if the file doesn't exist.
     """
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+    st = _stat_file(file_path)
+    if st is None:
         return f"No such file: {file_path}"
     
-    with open(file_path, "r") as f:
-        return f.read()
+    # Slurp the bytes with raw os.read calls and decode once, instead of
+    # going through the buffered TextIOWrapper decoder.
+    limit = MAX_READ_BYTES + 1
+    chunks = []
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        while limit > 0:
+            chunk = os.read(fd, min(limit, max(st.st_size, 65536)))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            limit -= len(chunk)
+    finally:
+        os.close(fd)
+    data = b"".join(chunks)
+    
+    truncated = len(data) > MAX_READ_BYTES
+    content = data[:MAX_READ_BYTES].decode("utf-8", "replace")
+    if "\r" in content:
+        # Match text-mode universal newlines
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    
+    if truncated:
+        return (
+            f"{content}\n\n[... FILE TRUNCATED after "
+            f"{MAX_READ_BYTES:,} bytes. Use grep() to search the rest ...]"
+        )
+    return content
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a grep pattern once; the agent often repeats the same search."""
+    return re.compile(pattern=pattern, flags=re.MULTILINE)
 
 
 def grep_file_content(file_path: str, pattern: str) -> str:
@@ -149,20 +284,51 @@ def grep_file_content(file_path: str, pattern: str) -> str:
         A formatted string with matches, "No matches found",
         or an error message if the file doesn't exist.
     """
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+    st = _stat_file(file_path)
+    if st is None:
         return f"No such file: {file_path}"
     
+    # Match against decoded text so \w, \b and (?i) keep their Unicode
+    # meaning and CRLF files read as plain "\n" lines.
     with open(file_path, "r") as f:
         content = f.read()
-    
-    regex = re.compile(pattern=pattern, flags=re.MULTILINE)
-    matches = regex.findall(content)
+    matches = _compile_pattern(pattern).findall(content)
     
     if matches:
         return f"MATCHES for {pattern} in {file_path}:\n\n- " + "\n- ".join(matches)
     return "No matches found"
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a single-component glob pattern once."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+
+def _glob_one_level(dirname: str, pattern: str) -> list[str]:
+    """
+    Match *pattern* against the entries of one directory.
+    
+    Same results and order as ``glob.glob(os.path.join(dirname, pattern))``
+    for a pattern without separators, in a single scandir pass that
+    filters on the entry names alone.
+    """
+    match = _compile_glob(pattern).match
+    include_hidden = pattern.startswith(".")
+    matches = []
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            for entry in it:
+                name = entry.name
+                if (include_hidden or name[0] != ".") and match(
+                    os.path.normcase(name)
+                ):
+                    matches.append(os.path.join(dirname, name))
+    except OSError:
+        return []
+    return matches
+
+
 def glob_paths(directory: str, pattern: str) -> str:
     """
     Find files matching a glob pattern in a directory.
@@ -175,12 +341,21 @@ def glob_paths(directory: str, pattern: str) -> str:
         A formatted string with matching paths, "No matches found",
         or an error message if the directory doesn't exist.
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    if not os.path.isdir(directory):
         return f"No such directory: {directory}"
     
     # Use pathlib for cleaner path handling
-    search_path = Path(directory) / pattern
-    matches = glob_module.glob(str(search_path))
+    search_path = str(Path(directory) / pattern)
+    dirname, basename = os.path.split(search_path)
+    if (
+        basename == pattern
+        and glob_module.has_magic(pattern)
+        and not glob_module.has_magic(dirname)
+    ):
+        # The common "*.pdf" case: a wildcard over a single directory.
+        matches = _glob_one_level(dirname, pattern)
+    else:
+        matches = glob_module.glob(search_path)
     
     if matches:
         return f"MATCHES for {pattern} in {directory}:\n\n- " + "\n- ".join(matches)
@@ -205,7 +380,8 @@ def preview_file(file_path: str, max_chars: int = DEFAULT_PREVIEW_CHARS) -> str:
     Returns:
         A preview of the document content, or an error message.
     """
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+    st = _stat_file(file_path)
+    if st is None:
         return f"No such file: {file_path}"
 
     ext = os.path.splitext(file_path)[1].lower()
@@ -216,7 +392,7 @@ def preview_file(file_path: str, max_chars: int = DEFAULT_PREVIEW_CHARS) -> str:
         )
 
     try:
-        full_content = _get_cached_or_parse(file_path)
+        full_content = _get_cached_or_parse(file_path, st)
         preview = full_content[:max_chars]
         
         total_len = len(full_content)
@@ -246,7 +422,8 @@ def parse_file(file_path: str) -> str:
     Returns:
         The complete document content as markdown, or an error message.
     """
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+    st = _stat_file(file_path)
+    if st is None:
         return f"No such file: {file_path}"
 
     ext = os.path.splitext(file_path)[1].lower()
@@ -257,7 +434,7 @@ def parse_file(file_path: str) -> str:
         )
 
     try:
-        return _get_cached_or_parse(file_path)
+        return _get_cached_or_parse(file_path, st)
     except Exception as e:
         return f"Error parsing {file_path}: {e}"
 
@@ -266,36 +443,130 @@ def parse_file(file_path: str) -> str:
 # Parallel Document Scanning
 # =============================================================================
 
-def _preview_single_file(file_path: str, preview_chars: int) -> dict:
+# Docling conversion is CPU-bound and mostly holds the GIL, so scan_folder
+# parses in worker processes. The pool is created on first use and kept for
+# the life of the process, so workers pay Docling's start-up cost only once.
+# scan_folder may run on several threads at once (the agent calls it through
+# asyncio.to_thread), so the pool is only swapped and submitted to under a lock.
+# Workers are spawned rather than forked: the pool is created from a worker
+# thread while other threads run, and the parent may already hold Docling's
+# torch models, so a forked child could inherit a lock it can never take.
+_PARSE_POOL: ProcessPoolExecutor | None = None
+_PARSE_POOL_WORKERS = 0
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _submit_parses(
+    file_paths: list[str], max_workers: int
+) -> tuple[ProcessPoolExecutor, dict[Future[str], str]]:
+    """
+    Queue *file_paths* for parsing on the shared pool.
+    
+    A request for a different worker count replaces the pool, but the old
+    one is shut down without cancelling, so scans already using it finish.
+    """
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None or _PARSE_POOL_WORKERS != max_workers:
+            if _PARSE_POOL is not None:
+                _PARSE_POOL.shutdown(wait=False)
+            _PARSE_POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _PARSE_POOL_WORKERS = max_workers
+        pool = _PARSE_POOL
+        futures = {pool.submit(_parse_document, f): f for f in file_paths}
+    return pool, futures
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool (a worker died) so the next scan starts a fresh one."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+
+
+@atexit.register
+def _shutdown_parse_pool() -> None:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        pool, _PARSE_POOL = _PARSE_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(slots=True)
+class PreviewResult:
+    """Scan outcome for a single document."""
+
+    file: str
+    filename: str
+    preview: str
+    total_chars: int
+    status: str
+
+
+def _preview_result(
+    file_path: str,
+    preview_chars: int,
+    content: str | None = None,
+    error: BaseException | None = None,
+) -> PreviewResult:
     """
-    Helper to preview a single file for parallel processing.
+    Build the scan result for a single file.
     
     Args:
         file_path: Path to the document file.
         preview_chars: Number of characters to include in preview.
+        content: The parsed document content, if parsing succeeded.
+        error: The parsing error, if parsing failed.
     
     Returns:
-        A dictionary with file info and preview content.
+        The file info and preview content.
     """
     filename = os.path.basename(file_path)
-    try:
-        content = _get_cached_or_parse(file_path)
-        preview = content[:preview_chars]
-        return {
-            "file": file_path,
-            "filename": filename,
-            "preview": preview,
-            "total_chars": len(content),
-            "status": "success"
-        }
-    except Exception as e:
-        return {
-            "file": file_path,
-            "filename": filename,
-            "preview": "",
-            "total_chars": 0,
-            "status": f"error: {e}"
-        }
+    if content is None:
+        return PreviewResult(file_path, filename, "", 0, f"error: {error}")
+    return PreviewResult(
+        file_path, filename, content[:preview_chars], len(content), "success"
+    )
+
+
+_BLOCK_TOP = "┌─────────────────────────────────────────────────────────────\n"
+_BLOCK_RULE = "├─────────────────────────────────────────────────────────────\n"
+_BLOCK_BOTTOM = "└─────────────────────────────────────────────────────────────\n"
+
+
+def _format_preview(result: PreviewResult, index: int, total: int) -> str:
+    """Render one document's block of the scan_folder report."""
+    if result.status == "success" and result.preview:
+        preview = result.preview
+        # Locate the end of the first MAX_PREVIEW_LINES lines and indent them
+        # with one replace, instead of splitting into a string per line.
+        cut = -1
+        for _ in range(MAX_PREVIEW_LINES):
+            cut = preview.find("\n", cut + 1)
+            if cut < 0:
+                break
+        if cut >= 0:
+            body = "│ " + preview[:cut].replace("\n", "\n│ ")
+            body += "\n│ ... (preview truncated)\n"
+        else:
+            body = "│ " + preview.replace("\n", "\n│ ") + "\n"
+    else:
+        body = "│ [No preview available]\n"
+    
+    return (
+        f"{_BLOCK_TOP}"
+        f"│ [{index}/{total}] {result.filename}\n"
+        f"│ Path: {result.file}\n"
+        f"│ Status: {result.status} | Total size: {result.total_chars:,} chars\n"
+        f"{_BLOCK_RULE}"
+        f"{body}"
+        f"{_BLOCK_BOTTOM}"
+    )
 
 
 def scan_folder(
@@ -318,17 +589,18 @@ def scan_folder(
     Returns:
         A formatted summary of all documents with their previews.
     """
-    if not os.path.exists(directory) or not os.path.isdir(directory):
+    if not os.path.isdir(directory):
         return f"No such directory: {directory}"
     
     # Find all supported document files
     doc_files = []
-    for item in os.listdir(directory):
-        item_path = os.path.join(directory, item)
-        if os.path.isfile(item_path):
-            ext = os.path.splitext(item)[1].lower()
-            if ext in SUPPORTED_EXTENSIONS:
-                doc_files.append(item_path)
+    with os.scandir(directory) as it:
+        for entry in it:
+            if (
+                entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+            ):
+                doc_files.append(entry.path)
     
     if not doc_files:
         return (
@@ -336,52 +608,61 @@ def scan_folder(
             f"Supported extensions: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
         )
     
-    # Scan all documents in parallel
+    # Serve cached documents directly and parse the rest in parallel
     results = []
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_file = {
-            executor.submit(_preview_single_file, f, preview_chars): f 
-            for f in doc_files
-        }
+    to_parse = {}
+    for f in doc_files:
+        try:
+            cache_key = _document_cache_key(f)
+        except OSError as e:
+            results.append(_preview_result(f, preview_chars, error=e))
+            continue
+        cached = _cache_lookup(cache_key)
+        if cached is not None:
+            results.append(_preview_result(f, preview_chars, content=cached))
+        else:
+            to_parse[f] = cache_key
+    
+    if to_parse:
+        pool, future_to_file = _submit_parses(list(to_parse), max_workers)
         for future in as_completed(future_to_file):
-            results.append(future.result())
+            f = future_to_file[future]
+            try:
+                content = future.result()
+            except BrokenProcessPool as e:
+                _discard_parse_pool(pool)
+                results.append(_preview_result(f, preview_chars, error=e))
+                continue
+            except Exception as e:
+                results.append(_preview_result(f, preview_chars, error=e))
+                continue
+            # Populate this process's cache so later preview_file/parse_file
+            # calls don't parse the document again.
+            _cache_store(to_parse[f], content)
+            results.append(_preview_result(f, preview_chars, content=content))
     
     # Sort by filename for consistent ordering
-    results.sort(key=lambda x: x["filename"])
+    results.sort(key=lambda r: r.filename)
     
     # Build the summary report
-    output = []
-    output.append("═══════════════════════════════════════════════════════════════")
-    output.append(f"  PARALLEL DOCUMENT SCAN: {directory}")
-    output.append(f"  Found {len(results)} documents")
-    output.append("═══════════════════════════════════════════════════════════════")
-    output.append("")
-    
-    for i, result in enumerate(results, 1):
-        output.append("┌─────────────────────────────────────────────────────────────")
-        output.append(f"│ [{i}/{len(results)}] {result['filename']}")
-        output.append(f"│ Path: {result['file']}")
-        output.append(f"│ Status: {result['status']} | Total size: {result['total_chars']:,} chars")
-        output.append("├─────────────────────────────────────────────────────────────")
-        
-        if result['status'] == 'success' and result['preview']:
-            # Indent the preview content
-            preview_lines = result['preview'].split('\n')
-            for line in preview_lines[:MAX_PREVIEW_LINES]:
-                output.append(f"│ {line}")
-            if len(preview_lines) > MAX_PREVIEW_LINES:
-                output.append("│ ... (preview truncated)")
-        else:
-            output.append("│ [No preview available]")
-        
-        output.append("└─────────────────────────────────────────────────────────────")
-        output.append("")
-    
-    output.append("═══════════════════════════════════════════════════════════════")
-    output.append("  NEXT STEPS:")
-    output.append("  1. Assess which documents are RELEVANT to the user's query")
-    output.append("  2. Use parse_file() for DEEP DIVE into relevant documents")
-    output.append("  3. Watch for cross-references to other docs (may need backtracking)")
-    output.append("═══════════════════════════════════════════════════════════════")
+    total = len(results)
+    output = [
+        "═══════════════════════════════════════════════════════════════",
+        f"  PARALLEL DOCUMENT SCAN: {directory}",
+        f"  Found {total} documents",
+        "═══════════════════════════════════════════════════════════════",
+        "",
+    ]
+    output.extend(
+        _format_preview(result, i, total) for i, result in enumerate(results, 1)
+    )
+    output.extend([
+        "═══════════════════════════════════════════════════════════════",
+        "  NEXT STEPS:",
+        "  1. Assess which documents are RELEVANT to the user's query",
+        "  2. Use parse_file() for DEEP DIVE into relevant documents",
+        "  3. Watch for cross-references to other docs (may need backtracking)",
+        "═══════════════════════════════════════════════════════════════",
+    ])
     
     return "\n".join(output)
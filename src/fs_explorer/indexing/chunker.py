@@ -4,6 +4,7 @@ Chunking utilities for indexing document content.
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 
 
@@ -43,6 +44,15 @@ class SmartChunker:
         if not normalized:
             return []
 
+        # Offsets of every paragraph break (overlapping runs included), found
+        # once up front so each chunk's boundary search is a bisect instead of
+        # an rfind over the window.
+        boundaries: list[int] = []
+        index = normalized.find("\n\n")
+        while index != -1:
+            boundaries.append(index)
+            index = normalized.find("\n\n", index + 1)
+
         chunks: list[TextChunk] = []
         start = 0
         position = 0
@@ -53,9 +63,10 @@ class SmartChunker:
             end = tentative_end
 
             if tentative_end < total:
-                boundary = normalized.rfind("\n\n", start + (self.chunk_size // 2), tentative_end)
-                if boundary != -1:
-                    end = boundary + 2
+                # Last break that fits entirely before tentative_end.
+                idx = bisect.bisect_right(boundaries, tentative_end - 2) - 1
+                if idx >= 0 and boundaries[idx] >= start + (self.chunk_size // 2):
+                    end = boundaries[idx] + 2
 
             chunk_text = normalized[start:end].strip()
             if chunk_text:
@@ -5,12 +5,14 @@ Metadata extraction helpers for indexed documents.
 from __future__ import annotations
 
 import copy
+import functools
+import itertools
 import json
 import os
 import re
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Collection, Iterable
 
 
 _CURRENCY_RE = re.compile(r"\$\s?\d[\d,]*(?:\.\d+)?")
@@ -20,7 +22,9 @@ _DATE_RE = re.compile(
     flags=re.IGNORECASE,
 )
 _DOC_TYPE_TOKEN_RE = re.compile(r"[a-z0-9]+")
-_DOC_TYPE_STOPWORDS: set[str] = {
+_MD_FENCE_OPEN_RE = re.compile(r"^```[a-z]*\n?")
+_MD_FENCE_CLOSE_RE = re.compile(r"\n?```$")
+_DOC_TYPE_STOPWORDS: frozenset[str] = frozenset({
     "the",
     "and",
     "for",
@@ -37,7 +41,7 @@ _DOC_TYPE_STOPWORDS: set[str] = {
     "old",
     "tmp",
     "temp",
-}
+})
 
 _LANGEXTRACT_PROMPT_DESCRIPTION = (
     "Extract key transaction metadata from legal and deal documents. "
@@ -46,8 +50,10 @@ _LANGEXTRACT_PROMPT_DESCRIPTION = (
 )
 
 _VALID_METADATA_FIELD_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
-_VALID_FIELD_TYPES: set[str] = {"string", "integer", "number", "boolean"}
-_VALID_RUNTIME_FIELDS: set[str] = {"enabled", "extraction_count", "entity_classes"}
+_VALID_FIELD_TYPES: frozenset[str] = frozenset({"string", "integer", "number", "boolean"})
+_VALID_RUNTIME_FIELDS: frozenset[str] = frozenset(
+    {"enabled", "extraction_count", "entity_classes"}
+)
 _FIELD_MODE_ALIASES: dict[str, str] = {
     "csv": "values",
     "list": "values",
@@ -59,6 +65,10 @@ _FIELD_MODE_ALIASES: dict[str, str] = {
     "contains": "contains",
     "contains_any": "contains",
 }
+# Pre-rendered "allowed values" lists for validation error messages.
+_ALLOWED_FIELD_TYPES_STR = ", ".join(sorted(_VALID_FIELD_TYPES))
+_ALLOWED_RUNTIME_FIELDS_STR = ", ".join(sorted(_VALID_RUNTIME_FIELDS))
+_ALLOWED_FIELD_MODES_STR = ", ".join(sorted(set(_FIELD_MODE_ALIASES.values())))
 
 _DEFAULT_LANGEXTRACT_PROFILE: dict[str, Any] = {
     "name": "default_langextract",
@@ -231,6 +241,11 @@ def auto_discover_profile(
     """
     from .schema import _iter_supported_files
 
+    # Without a key the LLM call cannot happen, so don't parse samples for it.
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        return default_langextract_profile()
+
     files = _iter_supported_files(folder)
     if not files:
         return default_langextract_profile()
@@ -243,23 +258,22 @@ def auto_discover_profile(
     # Parse and truncate
     from ..fs import parse_file
 
+    # Parse the samples concurrently; parsing is mostly I/O and native code.
     snippets: list[str] = []
-    for file_path in sampled:
-        try:
-            text = parse_file(file_path)
-            snippets.append(
-                f"--- {Path(file_path).name} ---\n{text[:2000]}"
-            )
-        except Exception:
-            continue
+    with ThreadPoolExecutor(max_workers=min(8, len(sampled))) as executor:
+        futures = [executor.submit(parse_file, file_path) for file_path in sampled]
+        for file_path, future in zip(sampled, futures):
+            try:
+                text = future.result()
+                snippets.append(
+                    f"--- {os.path.basename(file_path)} ---\n{text[:2000]}"
+                )
+            except Exception:
+                continue
 
     if not snippets:
         return default_langextract_profile()
 
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        return default_langextract_profile()
-
     effective_model = model_id or os.getenv(
         "FS_EXPLORER_PROFILE_MODEL", "gemini-2.0-flash"
     )
@@ -276,8 +290,8 @@ def auto_discover_profile(
         raw_text = (response.text or "").strip()
         # Strip markdown fencing if present
         if raw_text.startswith("```"):
-            raw_text = re.sub(r"^```[a-z]*\n?", "", raw_text)
-            raw_text = re.sub(r"\n?```$", "", raw_text).strip()
+            raw_text = _MD_FENCE_OPEN_RE.sub("", raw_text, count=1)
+            raw_text = _MD_FENCE_CLOSE_RE.sub("", raw_text, count=1).strip()
         profile = json.loads(raw_text)
         # Add runtime fields that are always present
         runtime_fields = [
@@ -296,15 +310,16 @@ def auto_discover_profile(
 
 def infer_document_type(file_path: str) -> str:
     """Infer a generic document type from filename tokens."""
-    stem = Path(file_path).stem.lower()
-    tokens = [token for token in _DOC_TYPE_TOKEN_RE.findall(stem) if token]
-    filtered = [
-        token
-        for token in tokens
-        if not token.isdigit() and len(token) > 2 and token not in _DOC_TYPE_STOPWORDS
-    ]
-    if filtered:
-        return filtered[-1]
+    return _document_type_from_stem(Path(file_path).stem.lower())
+
+
+def _document_type_from_stem(stem: str) -> str:
+    tokens = _DOC_TYPE_TOKEN_RE.findall(stem)
+    # The answer is the last meaningful token, so scan from the end and stop
+    # at the first one instead of filtering the whole list.
+    for token in reversed(tokens):
+        if len(token) > 2 and not token.isdigit() and token not in _DOC_TYPE_STOPWORDS:
+            return token
     if tokens:
         return tokens[-1]
     return "document"
@@ -335,7 +350,42 @@ def normalize_langextract_profile(profile: dict[str, Any] | None) -> dict[str, A
         contains_any: list[str] (contains mode),
       }]
     """
-    raw = default_langextract_profile() if profile is None else copy.deepcopy(profile)
+    return copy.deepcopy(_normalized_profile(profile))
+
+
+def _normalized_profile(profile: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Normalize *profile*, reusing the result for identical profiles.
+
+    The indexing loop normalizes the same profile for every document, so
+    results are cached by the profile's canonical JSON. The returned dict
+    is shared and must not be mutated; ``normalize_langextract_profile``
+    hands out copies.
+    """
+    if profile is None:
+        return _default_normalized_profile()
+    try:
+        key = json.dumps(profile, sort_keys=True)
+    except (TypeError, ValueError):
+        # Not plain JSON data; validate it without caching.
+        return _normalize_profile_uncached(profile)
+    return _normalize_profile_json(key)
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_profile_json(profile_json: str) -> dict[str, Any]:
+    return _normalize_profile_uncached(json.loads(profile_json))
+
+
+@functools.lru_cache(maxsize=1)
+def _default_normalized_profile() -> dict[str, Any]:
+    return _normalize_profile_uncached(_DEFAULT_LANGEXTRACT_PROFILE)
+
+
+def _normalize_profile_uncached(profile: dict[str, Any] | None) -> dict[str, Any]:
+    # Normalization only reads *profile* and builds fresh containers for its
+    # result, so neither the input nor the built-in template is copied.
+    raw = _DEFAULT_LANGEXTRACT_PROFILE if profile is None else profile
     if not isinstance(raw, dict):
         raise ValueError("Metadata profile must be a JSON object.")
 
@@ -384,10 +434,9 @@ def normalize_langextract_profile(profile: dict[str, Any] | None) -> dict[str, A
 
         field_type = str(raw_field.get("type", "string")).strip().lower()
         if field_type not in _VALID_FIELD_TYPES:
-            allowed_types = ", ".join(sorted(_VALID_FIELD_TYPES))
             raise ValueError(
                 f"Metadata field '{name}' has invalid type '{field_type}'. "
-                f"Allowed types: {allowed_types}."
+                f"Allowed types: {_ALLOWED_FIELD_TYPES_STR}."
             )
 
         description_obj = raw_field.get("description")
@@ -416,10 +465,9 @@ def normalize_langextract_profile(profile: dict[str, Any] | None) -> dict[str, A
         if source == "runtime":
             runtime = str(raw_field.get("runtime", "")).strip().lower()
             if runtime not in _VALID_RUNTIME_FIELDS:
-                allowed_runtime = ", ".join(sorted(_VALID_RUNTIME_FIELDS))
                 raise ValueError(
                     f"Metadata field '{name}' has invalid runtime source '{runtime}'. "
-                    f"Allowed runtime values: {allowed_runtime}."
+                    f"Allowed runtime values: {_ALLOWED_RUNTIME_FIELDS_STR}."
                 )
             normalized["runtime"] = runtime
             normalized["mode"] = "runtime"
@@ -465,7 +513,7 @@ def langextract_schema_fields(
     profile: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Return schema field definitions for langextract metadata."""
-    normalized = normalize_langextract_profile(profile)
+    normalized = _normalized_profile(profile)
     fields: list[dict[str, Any]] = []
     for field in normalized["fields"]:
         fields.append(
@@ -489,7 +537,7 @@ def ensure_langextract_schema_fields(
     profile: dict[str, Any] | None = None,
 ) -> tuple[dict[str, Any], bool]:
     """Ensure schema contains langextract field definitions."""
-    normalized_profile = normalize_langextract_profile(
+    normalized_profile = _normalized_profile(
         profile if profile is not None else _schema_profile_if_present(schema_def)
     )
     required_fields = langextract_schema_fields(normalized_profile)
@@ -519,7 +567,7 @@ def ensure_langextract_schema_fields(
     existing_profile = _schema_profile_if_present(schema_def)
     if profile is not None or existing_profile is not None:
         if existing_profile != normalized_profile:
-            merged["metadata_profile"] = normalized_profile
+            merged["metadata_profile"] = copy.deepcopy(normalized_profile)
             changed = True
         elif "metadata_profile" in schema_def:
             merged["metadata_profile"] = existing_profile
@@ -536,25 +584,30 @@ def extract_metadata(
     with_langextract: bool = False,
     langextract_model_id: str | None = None,
     langextract_profile: dict[str, Any] | None = None,
+    allowed_fields: Collection[str] | None = None,
 ) -> dict[str, Any]:
     """
     Build metadata used for filtering and schema-aware indexing.
 
     If a schema is provided with a `fields` list, only those keys are emitted.
+    Callers indexing many files against one schema can pass its field names
+    as `allowed_fields` so they are not collected again for every file.
     """
-    absolute_path = str(Path(file_path).resolve())
-    relative_path = os.path.relpath(absolute_path, str(Path(root_path).resolve()))
-    extension = Path(file_path).suffix.lower()
+    absolute_path = os.path.realpath(file_path)
+    relative_path = os.path.relpath(absolute_path, os.path.realpath(root_path))
+    filename = os.path.basename(file_path)
+    stem, extension = os.path.splitext(filename)
 
     stat = os.stat(file_path)
     metadata: dict[str, Any] = {
-        "filename": Path(file_path).name,
+        "filename": filename,
         "relative_path": relative_path,
-        "extension": extension,
-        "document_type": infer_document_type(file_path),
+        "extension": extension.lower(),
+        "document_type": _document_type_from_stem(stem.lower()),
         "file_size_bytes": int(stat.st_size),
         "file_mtime": float(stat.st_mtime),
-        "mentions_currency": bool(_CURRENCY_RE.search(content)),
+        # Every currency match starts with "$"; most documents have none.
+        "mentions_currency": "$" in content and bool(_CURRENCY_RE.search(content)),
         "mentions_dates": bool(_DATE_RE.search(content)),
     }
     if with_langextract:
@@ -573,16 +626,19 @@ def extract_metadata(
     if not schema_def:
         return metadata
 
-    fields = schema_def.get("fields")
-    if not isinstance(fields, list):
-        return metadata
+    if allowed_fields is not None:
+        allowed = allowed_fields
+    else:
+        fields = schema_def.get("fields")
+        if not isinstance(fields, list):
+            return metadata
 
-    allowed: set[str] = set()
-    for field in fields:
-        if isinstance(field, dict):
-            name = field.get("name")
-            if isinstance(name, str):
-                allowed.add(name)
+        allowed = set()
+        for field in fields:
+            if isinstance(field, dict):
+                name = field.get("name")
+                if isinstance(name, str):
+                    allowed.add(name)
 
     if not allowed:
         return metadata
@@ -596,7 +652,7 @@ def _extract_langextract_metadata(
     model_id: str | None = None,
     profile: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    normalized_profile = normalize_langextract_profile(profile)
+    normalized_profile = _normalized_profile(profile)
     defaults = _profile_defaults(normalized_profile)
 
     api_key = (
@@ -606,6 +662,10 @@ def _extract_langextract_metadata(
     )
     if not api_key:
         return defaults
+    # Blank documents never reach the model; checking first also skips the
+    # langextract import and the max_chars lookup for them.
+    if not content or content.isspace():
+        return defaults
 
     try:
         import langextract as lx  # type: ignore[import-not-found]
@@ -628,7 +688,7 @@ def _extract_langextract_metadata(
         minimum=500,
     )
     snippet = content[:max_chars]
-    if not snippet.strip():
+    if snippet.isspace():
         return defaults
 
     effective_model_id = model_id or os.getenv(
@@ -677,25 +737,19 @@ def _resolve_langextract_profile(
 
 
 def _normalize_source_classes(raw_field: dict[str, Any]) -> list[str]:
-    classes: list[str] = []
-    single = raw_field.get("source_class")
-    if isinstance(single, str) and single.strip():
-        classes.append(single.strip().lower())
-
+    candidates: list[Any] = [raw_field.get("source_class")]
     multi = raw_field.get("source_classes")
     if isinstance(multi, list):
-        for item in multi:
-            if isinstance(item, str) and item.strip():
-                classes.append(item.strip().lower())
+        candidates.extend(multi)
 
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for class_name in classes:
-        if class_name in seen:
-            continue
-        seen.add(class_name)
-        deduped.append(class_name)
-    return deduped
+    # dict keys keep first-seen order, so one mapping does the dedup.
+    classes: dict[str, None] = {}
+    for item in candidates:
+        if isinstance(item, str):
+            class_name = item.strip().lower()
+            if class_name:
+                classes[class_name] = None
+    return list(classes)
 
 
 def _normalize_field_mode(mode_obj: Any, *, field_type: str) -> str:
@@ -703,10 +757,9 @@ def _normalize_field_mode(mode_obj: Any, *, field_type: str) -> str:
         requested = mode_obj.strip().lower()
         normalized = _FIELD_MODE_ALIASES.get(requested)
         if normalized is None:
-            allowed = ", ".join(sorted(set(_FIELD_MODE_ALIASES.values())))
             raise ValueError(
                 f"Unsupported metadata field mode '{requested}'. "
-                f"Allowed modes: {allowed}."
+                f"Allowed modes: {_ALLOWED_FIELD_MODES_STR}."
             )
         return normalized
 
@@ -777,21 +830,44 @@ def _aggregate_profile_metadata(
     enabled: bool,
 ) -> dict[str, Any]:
     classes: set[str] = set()
-    by_class: dict[str, list[str]] = defaultdict(list)
+    # One preallocated bucket per class some entity field reads; extractions
+    # of any other class only count towards ``classes``.
+    by_class: dict[str, list[str]] = {
+        extraction_class: []
+        for field in normalized_profile["fields"]
+        for extraction_class in field["source_classes"]
+    }
 
     for extraction in extractions:
-        extraction_class = str(getattr(extraction, "extraction_class", "")).strip().lower()
-        extraction_text = str(getattr(extraction, "extraction_text", "")).strip()
+        # LangExtract hands back plain strings; only coerce anything else.
+        try:
+            raw_class = extraction.extraction_class
+        except AttributeError:
+            continue
+        if not isinstance(raw_class, str):
+            raw_class = str(raw_class)
+        extraction_class = raw_class.strip().lower()
         if not extraction_class:
             continue
         classes.add(extraction_class)
+        bucket = by_class.get(extraction_class)
+        if bucket is None:
+            continue
+        try:
+            raw_text = extraction.extraction_text
+        except AttributeError:
+            continue
+        if not isinstance(raw_text, str):
+            raw_text = str(raw_text)
+        extraction_text = raw_text.strip()
         if extraction_text:
-            by_class[extraction_class].append(extraction_text)
+            bucket.append(extraction_text)
 
     metadata: dict[str, Any] = {}
     for field in normalized_profile["fields"]:
         name = str(field["name"])
         source = str(field["source"])
+        coerce = _FIELD_COERCERS.get(str(field["type"]), _coerce_str)
         if source == "runtime":
             value = _runtime_field_value(
                 field=field,
@@ -799,21 +875,15 @@ def _aggregate_profile_metadata(
                 extraction_count=len(extractions),
                 classes=classes,
             )
-            metadata[name] = _coerce_field_value(
-                value=value,
-                field_type=str(field["type"]),
-            )
+            metadata[name] = coerce(value)
             continue
 
-        matched_values: list[str] = []
-        for extraction_class in field["source_classes"]:
-            matched_values.extend(by_class.get(extraction_class, []))
-        value = _entity_field_value(field=field, matched_values=matched_values)
-        metadata[name] = _coerce_field_value(value=value, field_type=str(field["type"]))
+        buckets = [
+            by_class[extraction_class] for extraction_class in field["source_classes"]
+        ]
+        value = _entity_field_value(field=field, buckets=buckets)
+        metadata[name] = coerce(value)
 
-    defaults = _profile_defaults(normalized_profile)
-    for key, default_value in defaults.items():
-        metadata.setdefault(key, default_value)
     return metadata
 
 
@@ -834,42 +904,64 @@ def _runtime_field_value(
     return _default_field_value(field)
 
 
-def _entity_field_value(*, field: dict[str, Any], matched_values: list[str]) -> Any:
+def _entity_field_value(*, field: dict[str, Any], buckets: list[list[str]]) -> Any:
+    """
+    Compute an entity field from the per-class value lists it draws on.
+
+    *buckets* holds one list per matching source class, in ``source_classes``
+    order; count and exists modes never need them concatenated.
+    """
     mode = str(field.get("mode", "values"))
     if mode == "count":
-        return len(matched_values)
+        return sum(len(bucket) for bucket in buckets)
     if mode == "exists":
-        return bool(matched_values)
+        return any(buckets)
+    matched_values = itertools.chain.from_iterable(buckets)
     if mode == "contains":
-        terms = [str(term).lower() for term in field.get("contains_any", [])]
-        lowered_values = [value.lower() for value in matched_values]
-        return any(term in value for term in terms for value in lowered_values)
+        terms = tuple(str(term).lower() for term in field.get("contains_any", []))
+        if not terms:
+            return False
+        search = _contains_pattern(terms).search
+        return any(search(value) for value in matched_values)
     deduped = _dedupe_preserve_order(matched_values)
     return ", ".join(deduped)
 
 
-def _coerce_field_value(*, value: Any, field_type: str) -> Any:
-    if field_type == "boolean":
-        return bool(value)
-    if field_type == "integer":
-        if isinstance(value, bool):
-            return int(value)
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return 0
-    if field_type == "number":
-        if isinstance(value, bool):
-            return float(int(value))
-        try:
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
+@functools.lru_cache(maxsize=256)
+def _contains_pattern(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a field's ``contains_any`` terms into one case-insensitive regex."""
+    return re.compile("|".join(map(re.escape, terms)), flags=re.IGNORECASE)
+
+
+def _coerce_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _coerce_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _coerce_str(value: Any) -> str:
     if value is None:
         return ""
     return str(value)
 
 
+# Field type -> coercion; unknown types are treated as strings.
+_FIELD_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "boolean": bool,
+    "integer": _coerce_int,
+    "number": _coerce_float,
+    "string": _coerce_str,
+}
+
+
 def _langextract_examples(lx: Any) -> list[Any]:
     return [
         lx.data.ExampleData(
@@ -924,7 +1016,7 @@ def _langextract_examples(lx: Any) -> list[Any]:
     ]
 
 
-def _dedupe_preserve_order(values: list[str], *, max_items: int = 16) -> list[str]:
+def _dedupe_preserve_order(values: Iterable[str], *, max_items: int = 16) -> list[str]:
     seen: set[str] = set()
     deduped: list[str] = []
     for value in values:
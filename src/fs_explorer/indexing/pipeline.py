@@ -192,6 +192,10 @@ class IndexingPipeline:
         langextract_profile: dict[str, Any] | None,
     ) -> dict[str, dict[str, Any]]:
         """Extract metadata for all documents in parallel using a thread pool."""
+        # The schema is the same for every document; collect its field names once.
+        allowed_fields = (
+            frozenset(self._schema_field_names(schema_def)) if schema_def else None
+        )
 
         def _extract_one(item: tuple[str, str, str]) -> tuple[str, dict[str, Any]]:
             file_path, relative_path, content = item
@@ -202,6 +206,7 @@ class IndexingPipeline:
                 schema_def=schema_def,
                 with_langextract=with_langextract,
                 langextract_profile=langextract_profile,
+                allowed_fields=allowed_fields,
             )
             return relative_path, metadata
 
@@ -105,6 +105,9 @@ class StorageBackend(Protocol):
     def get_document(self, *, doc_id: str) -> dict[str, Any] | None:
         """Get a document by id."""
 
+    def get_document_meta(self, *, doc_id: str) -> dict[str, Any] | None:
+        """Get a document's path and deletion flag by id, without its content."""
+
     def save_schema(
         self,
         *,
@@ -435,6 +435,24 @@ class DuckDBStorage:
             "is_deleted": bool(row[6]),
         }
 
+    def get_document_meta(self, *, doc_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            """
+            SELECT id, absolute_path, is_deleted
+            FROM documents
+            WHERE id = ?
+            LIMIT 1
+            """,
+            [doc_id],
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": str(row[0]),
+            "absolute_path": str(row[1]),
+            "is_deleted": bool(row[2]),
+        }
+
     def save_schema(
         self,
         *,
@@ -2,22 +2,25 @@
 
 import pytest
 import os
+import threading
 
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 from google.genai import Client as GenAIClient
-from google.genai.types import HttpOptions
+from google.genai.types import GenerateContentResponse, HttpOptions
 
 from fs_explorer.agent import (
     FsExplorerAgent,
     SYSTEM_PROMPT,
+    TOOLS,
     TokenUsage,
     _build_system_prompt,
+    _generation_config,
     set_search_flags,
     get_search_flags,
     clear_index_context,
 )
-from fs_explorer.models import Action, StopAction
-from .conftest import MockGenAIClient
+from fs_explorer.models import Action, StopAction, ToolCallAction, ToolCallArg
+from .conftest import MockGenAIClient, MockModels
 
 
 class TestAgentInitialization:
@@ -97,6 +100,104 @@ class TestAgentActions:
         assert action.reason == "I am done"
         assert action_type == "stop"
 
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    async def test_take_action_uses_sdk_parsed_action(self) -> None:
+        """An Action already parsed by the SDK is used without re-validating."""
+        agent = FsExplorerAgent()
+        agent.configure_task("this is a task")
+        agent._client = MockGenAIClient(
+            api_key="test",
+            http_options=HttpOptions(api_version="v1beta")
+        )
+        parsed = Action(action=StopAction(final_result="parsed"), reason="sdk")
+        generate = MockModels.generate_content
+
+        async def generate_with_parsed(self, *args, **kwargs):
+            response = await generate(self, *args, **kwargs)
+            response.parsed = parsed
+            return response
+
+        with patch.object(
+            MockModels, "generate_content", generate_with_parsed
+        ), patch.object(Action, "model_validate_json") as validate_json:
+            result = await agent.take_action()
+
+        assert result is not None
+        assert result[0] is parsed
+        validate_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    async def test_take_action_validates_single_part_without_response_text(
+        self,
+    ) -> None:
+        """Without ``parsed``, the single text part is validated directly."""
+        agent = FsExplorerAgent()
+        agent.configure_task("this is a task")
+        agent._client = MockGenAIClient(
+            api_key="test",
+            http_options=HttpOptions(api_version="v1beta")
+        )
+        generate = MockModels.generate_content
+
+        async def generate_without_parsed(self, *args, **kwargs):
+            response = await generate(self, *args, **kwargs)
+            response.parsed = None
+            return response
+
+        with patch.object(
+            MockModels, "generate_content", generate_without_parsed
+        ), patch.object(
+            GenerateContentResponse, "text", new_callable=PropertyMock
+        ) as text:
+            result = await agent.take_action()
+
+        assert result is not None
+        assert result[1] == "stop"
+        text.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    async def test_take_action_runs_filesystem_tools_off_loop(self) -> None:
+        """Blocking filesystem tools do not run on the event loop thread."""
+        agent = FsExplorerAgent()
+        agent.configure_task("this is a task")
+        agent._client = MockGenAIClient(
+            api_key="test",
+            http_options=HttpOptions(api_version="v1beta")
+        )
+        toolcall = Action(
+            action=ToolCallAction(
+                tool_name="read",
+                tool_input=[
+                    ToolCallArg(parameter_name="file_path", parameter_value="a.txt")
+                ],
+            ),
+            reason="read it",
+        )
+        generate = MockModels.generate_content
+
+        async def generate_toolcall(self, *args, **kwargs):
+            response = await generate(self, *args, **kwargs)
+            response.parsed = toolcall
+            return response
+
+        tool_threads: list[int] = []
+
+        def fake_read(file_path: str) -> str:
+            tool_threads.append(threading.get_ident())
+            return "contents"
+
+        with patch.object(
+            MockModels, "generate_content", generate_toolcall
+        ), patch.dict(TOOLS, {"read": fake_read}):
+            result = await agent.take_action()
+
+        assert result is not None and result[1] == "toolcall"
+        assert tool_threads and tool_threads[0] != threading.get_ident()
+        assert agent._chat_history[-1].parts[0].text.endswith("contents")
+
     @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
     def test_reset_clears_history(self) -> None:
         """Test that reset clears chat history and token usage."""
@@ -109,6 +210,53 @@ class TestAgentActions:
         assert len(agent._chat_history) == 0
         assert agent.token_usage.api_calls == 0
 
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    def test_older_tool_results_are_trimmed_in_history(self) -> None:
+        """Only the newest tool result stays in full in the chat history."""
+        big = "x" * 20_000
+        agent = FsExplorerAgent()
+        agent.configure_task("task")
+        with patch.dict(TOOLS, {"read": lambda file_path: big}):
+            agent.call_tool("read", {"file_path": "a.txt"})
+            assert big in agent._chat_history[-1].parts[0].text
+
+            agent.call_tool("read", {"file_path": "b.txt"})
+
+        older = agent._chat_history[1].parts[0].text
+        assert big not in older
+        assert "[truncated, 12000 chars omitted;" in older
+        assert "call read(file_path='a.txt') again" in older
+        assert big in agent._chat_history[2].parts[0].text
+        assert agent.token_usage.tool_result_chars == 2 * len(big)
+
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    def test_call_tool_reports_unknown_tool(self) -> None:
+        """An unknown tool name is reported without attempting a call."""
+        agent = FsExplorerAgent()
+        agent.call_tool("nonexistent", {})  # type: ignore[arg-type]
+
+        text = agent._chat_history[-1].parts[0].text
+        assert "Unknown tool 'nonexistent'" in text
+        assert "semantic_search" in text
+
+    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test-api-key"})
+    def test_call_tool_reports_bad_arguments(self) -> None:
+        """Missing or unexpected arguments are reported by name."""
+        agent = FsExplorerAgent()
+        agent.call_tool("read", {})
+        assert "file_path" in agent._chat_history[-1].parts[0].text
+
+        agent.call_tool("read", {"file_path": "a.txt", "bogus": 1})
+        assert "bogus" in agent._chat_history[-1].parts[0].text
+
+
+    def test_generation_config_carries_action_json_schema(self) -> None:
+        """The Action schema is generated once per flag combination."""
+        config = _generation_config(False, False)
+        assert config.response_json_schema == Action.model_json_schema()
+        assert config.response_schema is None
+        assert _generation_config(False, False) is config
+
 
 class TestTokenUsage:
     """Tests for TokenUsage tracking."""
@@ -123,6 +271,13 @@ class TestTokenUsage:
         assert usage.total_tokens == 150
         assert usage.api_calls == 1
 
+    def test_token_usage_uses_slots(self) -> None:
+        """TokenUsage instances carry no per-instance __dict__."""
+        usage = TokenUsage()
+        assert not hasattr(usage, "__dict__")
+        with pytest.raises(AttributeError):
+            usage.unknown_field = 1  # type: ignore[attr-defined]
+
     def test_add_tool_result_parse_file(self) -> None:
         """Test tracking parse_file tool usage."""
         usage = TokenUsage()
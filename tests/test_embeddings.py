@@ -18,7 +18,7 @@ from fs_explorer.embeddings import EmbeddingProvider
 
 @dataclass
 class _FakeEmbedding:
-    values: list[float]
+    values: list[float] | None
 
 
 @dataclass
@@ -87,7 +87,9 @@ def test_embed_query_uses_query_task_type() -> None:
 
 def test_embed_texts_batching() -> None:
     client = _FakeClient()
-    provider = EmbeddingProvider(client=client, dim=4, batch_size=3)
+    provider = EmbeddingProvider(
+        client=client, dim=4, batch_size=3, max_concurrency=1
+    )
 
     texts = [f"text_{i}" for i in range(7)]
     embeddings = provider.embed_texts(texts)
@@ -100,6 +102,137 @@ def test_embed_texts_batching() -> None:
     assert len(client.models.calls[2]["contents"]) == 1
 
 
+class _EchoModels(_FakeModels):
+    """Returns each text's trailing number as its embedding."""
+
+    def embed_content(
+        self, *, model: str, contents: list[str], config: dict
+    ) -> _FakeEmbedResult:
+        self.calls.append({"model": model, "contents": contents, "config": config})
+        return _FakeEmbedResult(
+            embeddings=[
+                _FakeEmbedding(values=[float(text.rsplit("_", 1)[1])])
+                for text in contents
+            ]
+        )
+
+
+def test_concurrent_batches_keep_input_order() -> None:
+    client = _FakeClient()
+    client.models = _EchoModels()
+    provider = EmbeddingProvider(
+        client=client, dim=1, batch_size=2, max_concurrency=4
+    )
+
+    embeddings = provider.embed_texts([f"text_{i}" for i in range(7)])
+
+    assert len(client.models.calls) == 4
+    assert embeddings == [[float(i)] for i in range(7)]
+
+
+def test_embed_query_is_cached() -> None:
+    client = _FakeClient()
+    provider = EmbeddingProvider(client=client, dim=4)
+
+    first = provider.embed_query("purchase price")
+    second = provider.embed_query("purchase price")
+
+    assert first == second
+    assert len(client.models.calls) == 1
+
+
+def test_embed_texts_only_sends_uncached_texts() -> None:
+    client = _FakeClient()
+    provider = EmbeddingProvider(client=client, dim=4)
+
+    provider.embed_texts(["a", "b"])
+    embeddings = provider.embed_texts(["b", "c", "a"])
+
+    assert len(embeddings) == 3
+    assert client.models.calls[1]["contents"] == ["c"]
+    # Cached vectors come back at their original positions.
+    assert embeddings[0] == [1.0] * 4
+    assert embeddings[2] == [0.0] * 4
+
+
+def test_embed_texts_deduplicates_repeated_texts() -> None:
+    client = _FakeClient()
+    client.models = _EchoModels()
+    provider = EmbeddingProvider(client=client, dim=1, cache_size=0)
+
+    embeddings = provider.embed_texts(["t_1", "t_2", "t_1", "t_1"])
+
+    assert client.models.calls[0]["contents"] == ["t_1", "t_2"]
+    assert embeddings == [[1.0], [2.0], [1.0], [1.0]]
+
+
+def test_embedding_cache_is_bounded_and_keyed_by_task_type() -> None:
+    client = _FakeClient()
+    provider = EmbeddingProvider(client=client, dim=4, cache_size=1)
+
+    provider.embed_query("a")
+    provider.embed_texts(["a"])  # different task type: not a cache hit
+    provider.embed_query("a")  # evicted by the document embedding
+
+    assert len(client.models.calls) == 3
+
+
+def test_cached_vectors_are_not_shared_with_callers() -> None:
+    client = _FakeClient()
+    provider = EmbeddingProvider(client=client, dim=2)
+
+    first = provider.embed_query("a")
+    first.append(99.0)
+    texts = provider.embed_texts(["b", "b"])
+    texts[0][0] = 99.0
+
+    assert provider.embed_query("a") == [0.0, 0.0]
+    assert texts[1] == [0.0, 0.0]
+    assert provider.embed_texts(["b"]) == [[0.0, 0.0]]
+    assert len(client.models.calls) == 2
+
+
+def test_missing_embedding_values_raise() -> None:
+    class _NoValuesModels(_FakeModels):
+        def embed_content(self, **kwargs: Any) -> _FakeEmbedResult:
+            return _FakeEmbedResult(embeddings=[_FakeEmbedding(values=None)])
+
+    client = _FakeClient()
+    client.models = _NoValuesModels()
+    provider = EmbeddingProvider(client=client, dim=2)
+
+    with pytest.raises(ValueError, match="no values"):
+        provider.embed_query("a")
+    assert provider._cache_get("RETRIEVAL_QUERY", "a") is None
+
+
+
+def test_short_embedding_response_raises() -> None:
+    class _ShortModels(_FakeModels):
+        def embed_content(self, **kwargs: Any) -> _FakeEmbedResult:
+            result = super().embed_content(**kwargs)
+            result.embeddings.pop()
+            return result
+
+    client = _FakeClient()
+    client.models = _ShortModels()
+    provider = EmbeddingProvider(client=client, dim=2)
+
+    with pytest.raises(ValueError, match="1 vectors for 2 texts"):
+        provider.embed_texts(["a", "b"])
+    assert provider._cache_get("RETRIEVAL_DOCUMENT", "a") is None
+
+def test_embedding_cache_can_be_disabled(monkeypatch) -> None:
+    client = _FakeClient()
+    monkeypatch.setenv("FS_EXPLORER_EMBED_CACHE", "0")
+    provider = EmbeddingProvider(client=client, dim=4)
+
+    provider.embed_query("a")
+    provider.embed_query("a")
+
+    assert len(client.models.calls) == 2
+
+
 def test_env_overrides(monkeypatch) -> None:
     client = _FakeClient()
     monkeypatch.setenv("FS_EXPLORER_EMBEDDING_MODEL", "custom-model-001")
@@ -65,3 +65,22 @@ def test_extract_cited_sources_ordered_unique() -> None:
         "Reconfirmed [Source: agreement.pdf, Section 2.1]."
     )
     assert extract_cited_sources(final_result) == ["agreement.pdf", "escrow.pdf"]
+
+
+def test_trace_paths_match_normalize_path() -> None:
+    root = "project/../project/"
+    trace = ExplorationTrace(root_directory=root)
+
+    trace.record_tool_call(
+        step_number=1,
+        tool_name="read",
+        tool_input={"file_path": "./docs//a.txt"},
+        resolved_document_path="/var/data/../data/b.pdf",
+    )
+
+    assert trace.sorted_documents() == sorted(
+        [
+            normalize_path("./docs//a.txt", root),
+            normalize_path("/var/data/../data/b.pdf", root),
+        ]
+    )
@@ -5,6 +5,7 @@ import os
 import tempfile
 from pathlib import Path
 
+import fs_explorer.fs as fs_module
 from fs_explorer.fs import (
     describe_dir_content,
     read_file,
@@ -55,6 +56,24 @@ class TestReadFile:
         content = read_file("tests/testfiles/file2.txt")
         assert content == "No such file: tests/testfiles/file2.txt"
 
+    def test_large_file_is_truncated(self, tmp_path, monkeypatch) -> None:
+        """Test that reads are capped at MAX_READ_BYTES."""
+        monkeypatch.setattr(fs_module, "MAX_READ_BYTES", 10)
+        path = tmp_path / "big.txt"
+        path.write_text("a" * 25)
+
+        content = read_file(str(path))
+
+        assert content.startswith("a" * 10 + "\n\n[... FILE TRUNCATED")
+        assert "a" * 11 not in content
+
+    def test_newlines_and_invalid_utf8(self, tmp_path) -> None:
+        """Test that line endings are normalized and bad bytes don't raise."""
+        path = tmp_path / "mixed.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\xff\n")
+
+        assert read_file(str(path)) == "one\ntwo\nthree\ufffd\n"
+
 
 class TestGrepFileContent:
     """Tests for grep_file_content function."""
@@ -75,6 +94,48 @@ class TestGrepFileContent:
         result = grep_file_content("tests/testfiles/file2.txt", r"test")
         assert result == "No such file: tests/testfiles/file2.txt"
 
+    def test_repeated_pattern_is_compiled_once(self) -> None:
+        """Test that repeated searches reuse the compiled pattern."""
+        fs_module._compile_pattern.cache_clear()
+        grep_file_content("tests/testfiles/file2.md", r"(are|is) a test")
+        grep_file_content("tests/testfiles/file1.txt", r"(are|is) a test")
+        info = fs_module._compile_pattern.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_empty_file(self, tmp_path) -> None:
+        """Test searching an empty file."""
+        path = tmp_path / "empty.txt"
+        path.write_text("")
+        assert grep_file_content(str(path), r"test") == "No matches found"
+
+    def test_non_ascii_content_and_pattern(self, tmp_path) -> None:
+        """Test that matches are decoded and non-ASCII patterns still work."""
+        path = tmp_path / "prices.txt"
+        path.write_text("Prix: 45 €\nPrice: 50 €\n", encoding="utf-8")
+
+        assert "- Prix: 45 €" in grep_file_content(str(path), r"^Prix.*$")
+        assert "- 50 €" in grep_file_content(str(path), r"\d+ €")
+
+    def test_ascii_pattern_uses_unicode_semantics(self, tmp_path) -> None:
+        """Test that ASCII patterns still match non-ASCII text as characters."""
+        path = tmp_path / "names.txt"
+        path.write_text("Café Zoë\nÉCOLE\n", encoding="utf-8")
+
+        assert "- Café" in grep_file_content(str(path), r"\bCaf\w")
+        assert "- Zoë" in grep_file_content(str(path), r"Zo.")
+        assert "- ÉCOLE" in grep_file_content(str(path), r"(?i)^école$")
+        assert "- Zoë" in grep_file_content(str(path), r"(?u)Zo\w")
+
+    def test_crlf_line_endings(self, tmp_path) -> None:
+        """Test that CRLF files match line anchors without a trailing \\r."""
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"alpha line\r\nbeta line\r\n")
+
+        result = grep_file_content(str(path), r"^\w+ line$")
+
+        assert result.endswith("- alpha line\n- beta line")
+        assert "\r" not in result
+
 
 class TestGlobPaths:
     """Tests for glob_paths function."""
@@ -86,6 +147,21 @@ class TestGlobPaths:
         assert "file1.txt" in result
         assert "file2.md" in result
 
+    def test_single_level_pattern_matches_glob(self, tmp_path) -> None:
+        """Test that wildcard patterns keep glob's hidden-file rules."""
+        for name in ("a.txt", "b.md", ".hidden.txt"):
+            (tmp_path / name).write_text("x")
+        (tmp_path / "sub.txt").mkdir()
+
+        visible = glob_paths(str(tmp_path), "*.txt")
+        hidden = glob_paths(str(tmp_path), ".*.txt")
+
+        assert str(tmp_path / "a.txt") in visible
+        assert str(tmp_path / "sub.txt") in visible
+        assert ".hidden.txt" not in visible
+        assert "b.md" not in visible
+        assert str(tmp_path / ".hidden.txt") in hidden
+
     def test_no_match(self) -> None:
         """Test a pattern that matches nothing."""
         result = glob_paths("tests/testfiles", "nonexistent*")
@@ -151,6 +227,78 @@ class TestDocumentParsing:
             assert len(content) < 2000  # Preview + header + truncation message
 
 
+class _FakeConverter:
+    """Stands in for Docling: returns the file's text and counts parses."""
+
+    calls = 0
+
+    def convert(self, file_path: str):
+        type(self).calls += 1
+        text = Path(file_path).read_text()
+
+        class _Document:
+            def export_to_markdown(self) -> str:
+                return text
+
+        class _Result:
+            document = _Document()
+
+        return _Result()
+
+
+class TestDocumentCache:
+    """Tests for the bounded parsed-document cache."""
+
+    def setup_method(self) -> None:
+        clear_document_cache()
+        _FakeConverter.calls = 0
+
+    def teardown_method(self) -> None:
+        clear_document_cache()
+
+    def test_cache_hit_and_invalidation(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(fs_module, "_get_converter", _FakeConverter)
+        path = tmp_path / "doc.docx"
+        path.write_text("first")
+
+        assert parse_file(str(path)) == "first"
+        assert parse_file(str(path)) == "first"
+        assert _FakeConverter.calls == 1
+
+        path.write_text("second version")
+        assert parse_file(str(path)) == "second version"
+        assert _FakeConverter.calls == 2
+
+    def test_markdown_skips_docling(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(fs_module, "_get_converter", _FakeConverter)
+        path = tmp_path / "notes.md"
+        path.write_text("# Notes\n\nraw markdown")
+
+        assert parse_file(str(path)) == "# Notes\n\nraw markdown"
+        assert _FakeConverter.calls == 0
+
+    def test_cache_evicts_least_recently_used(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(fs_module, "_get_converter", _FakeConverter)
+        monkeypatch.setattr(fs_module, "DOCUMENT_CACHE_MAX_CHARS", 10)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.docx"
+            path.write_text(name * 4)
+            paths.append(str(path))
+
+        parse_file(paths[0])
+        parse_file(paths[1])
+        parse_file(paths[0])  # a is now the most recently used
+        parse_file(paths[2])  # 12 chars > 10: evicts b
+
+        assert len(fs_module._DOCUMENT_CACHE) == 2
+        assert fs_module._DOCUMENT_CACHE_CHARS == 8
+        parse_file(paths[0])
+        assert _FakeConverter.calls == 3
+        parse_file(paths[1])
+        assert _FakeConverter.calls == 4
+
+
 class TestScanFolder:
     """Tests for scan_folder function."""
     
@@ -171,6 +319,85 @@ class TestScanFolder:
             result = scan_folder(tmpdir)
             assert "No supported documents found" in result
 
+    def test_cached_documents_skip_the_parse_pool(self, tmp_path, monkeypatch) -> None:
+        """Test that already-parsed documents are previewed from the cache."""
+        path = tmp_path / "doc.md"
+        path.write_text("cached body")
+        fs_module._cache_store(fs_module._document_cache_key(str(path)), "cached body")
+        monkeypatch.setattr(
+            fs_module,
+            "_submit_parses",
+            lambda paths, max_workers: pytest.fail("parse pool used for a cached file"),
+        )
+
+        result = scan_folder(str(tmp_path))
+
+        assert "Status: success" in result
+        assert "│ cached body" in result
+
+    def test_concurrent_scans_with_different_worker_counts(self, tmp_path) -> None:
+        """Test that replacing the pool does not cancel another scan's work."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        for i in range(6):
+            (tmp_path / f"doc{i}.md").write_text(f"body {i}")
+
+        def scan(workers: int) -> str:
+            clear_document_cache()
+            return scan_folder(str(tmp_path), max_workers=workers)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(scan, [1, 2, 1, 2]))
+
+        for result in results:
+            assert result.count("Status: success") == 6
+
+    def test_parse_pool_spawns_workers(self, monkeypatch) -> None:
+        """Test that parse workers start clean instead of being forked."""
+        created: list[dict] = []
+
+        class _RecordingPool:
+            def __init__(self, **kwargs) -> None:
+                created.append(kwargs)
+
+            def shutdown(self, **kwargs) -> None:
+                pass
+
+        monkeypatch.setattr(fs_module, "ProcessPoolExecutor", _RecordingPool)
+        monkeypatch.setattr(fs_module, "_PARSE_POOL", None)
+        monkeypatch.setattr(fs_module, "_PARSE_POOL_WORKERS", 0)
+
+        fs_module._submit_parses([], max_workers=2)
+
+        assert created[0]["max_workers"] == 2
+        assert created[0]["mp_context"].get_start_method() == "spawn"
+
+    def test_preview_is_indented_and_cut_at_max_lines(self) -> None:
+        """Test that each preview line is indented and long previews are cut."""
+        lines = [f"line {i}" for i in range(fs_module.MAX_PREVIEW_LINES + 5)]
+        short = fs_module.PreviewResult("/d/a.md", "a.md", "x\ny", 3, "success")
+        long = fs_module.PreviewResult(
+            "/d/b.md", "b.md", "\n".join(lines), 999, "success"
+        )
+
+        short_block = fs_module._format_preview(short, 1, 2)
+        long_block = fs_module._format_preview(long, 2, 2)
+
+        assert "│ x\n│ y\n└" in short_block
+        assert "preview truncated" not in short_block
+        last_kept = fs_module.MAX_PREVIEW_LINES - 1
+        assert f"│ line {last_kept}\n│ ... (preview truncated)\n└" in long_block
+        assert f"line {last_kept + 1}" not in long_block
+
+    def test_parse_errors_are_reported_per_file(self, tmp_path) -> None:
+        """Test that a document failing to parse in a worker is reported."""
+        (tmp_path / "broken.pdf").write_bytes(b"not a pdf")
+
+        result = scan_folder(str(tmp_path), max_workers=1)
+
+        assert "broken.pdf" in result
+        assert "Status: error:" in result
+
     @pytest.mark.skipif(
         not os.path.exists("data/large_acquisition"),
         reason="Test documents not generated"
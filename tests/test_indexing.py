@@ -1,11 +1,14 @@
 """Tests for indexing and schema components."""
 
 import json
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import fs_explorer.indexing.metadata as metadata_module
 import fs_explorer.indexing.pipeline as pipeline_module
 from fs_explorer.embeddings import EmbeddingProvider
@@ -27,6 +30,18 @@ def test_smart_chunker_overlap() -> None:
     assert chunks[2].start_char == chunks[1].end_char - 100
 
 
+def test_smart_chunker_prefers_last_paragraph_break() -> None:
+    text = "A" * 60 + "\n\n" + "B" * 20 + "\n\n\n" + "C" * 60
+    chunker = SmartChunker(chunk_size=100, overlap=10)
+
+    chunks = chunker.chunk_text(text)
+
+    # The window [50, 100) holds breaks at 60, 82 and 83; the last one wins.
+    assert chunks[0].end_char == 85
+    assert chunks[0].text == "A" * 60 + "\n\n" + "B" * 20
+    assert chunks[1].start_char == 75
+
+
 def test_schema_discovery_from_folder(tmp_path: Path) -> None:
     folder = tmp_path / "corpus"
     folder.mkdir()
@@ -105,6 +120,142 @@ def test_schema_discovery_with_custom_metadata_profile(tmp_path: Path) -> None:
     assert isinstance(schema.get("metadata_profile"), dict)
 
 
+def test_normalize_langextract_profile_reuses_cached_result() -> None:
+    profile = {
+        "fields": [
+            {"name": "lx_people", "source_class": "person", "mode": "values"},
+        ]
+    }
+    metadata_module._normalize_profile_json.cache_clear()
+
+    first = normalize_langextract_profile(profile)
+    first["fields"][0]["name"] = "mutated"
+    second = normalize_langextract_profile(dict(profile))
+
+    assert second["fields"][0]["name"] == "lx_people"
+    assert metadata_module._normalize_profile_json.cache_info().hits == 1
+
+    with pytest.raises(ValueError):
+        normalize_langextract_profile({"fields": []})
+
+
+def test_default_profile_normalization_leaves_template_untouched() -> None:
+    from fs_explorer.indexing.metadata import default_langextract_profile
+
+    normalized = normalize_langextract_profile(None)
+    normalized["fields"].clear()
+
+    assert normalize_langextract_profile(None) == normalize_langextract_profile(
+        default_langextract_profile()
+    )
+    assert len(default_langextract_profile()["fields"]) == len(
+        normalize_langextract_profile(None)["fields"]
+    )
+
+
+def test_aggregate_profile_metadata_follows_source_class_order() -> None:
+    @dataclass
+    class _Extraction:
+        extraction_class: str
+        extraction_text: str
+
+    profile = normalize_langextract_profile(
+        {
+            "fields": [
+                {
+                    "name": "lx_orgs",
+                    "source_classes": ["organization", "company"],
+                    "mode": "values",
+                },
+                {
+                    "name": "lx_org_count",
+                    "type": "integer",
+                    "source_classes": ["organization", "company"],
+                },
+            ]
+        }
+    )
+    extractions = [
+        _Extraction("company", "Acme"),
+        _Extraction("organization", "Globex"),
+        _Extraction("company", "acme"),
+    ]
+
+    metadata = metadata_module._aggregate_profile_metadata(
+        normalized_profile=profile,
+        extractions=extractions,
+        enabled=True,
+    )
+
+    assert metadata == {"lx_orgs": "Globex, Acme", "lx_org_count": 3}
+
+
+def test_contains_mode_matches_literal_terms_case_insensitively() -> None:
+    field = {"mode": "contains", "contains_any": ["earn-out (5%)", "escrow"]}
+
+    assert metadata_module._entity_field_value(
+        field=field, buckets=[["Includes an EARN-OUT (5%) clause"]]
+    )
+    assert not metadata_module._entity_field_value(
+        field=field, buckets=[["earn-out 5%"], ["holdback"]]
+    )
+
+
+def test_extract_metadata_path_fields(tmp_path: Path) -> None:
+    nested = tmp_path / "deals"
+    nested.mkdir()
+    doc = nested / "Acme_Purchase-Agreement.v2.PDF"
+    doc.write_text("Total: $1,000 due 2025-01-31")
+
+    metadata = metadata_module.extract_metadata(
+        file_path=str(doc),
+        root_path=str(tmp_path),
+        content=doc.read_text(),
+    )
+
+    assert metadata["filename"] == "Acme_Purchase-Agreement.v2.PDF"
+    assert metadata["relative_path"] == str(Path("deals") / doc.name)
+    assert metadata["extension"] == ".pdf"
+    assert metadata["document_type"] == metadata_module.infer_document_type(str(doc))
+    assert metadata["document_type"] == "agreement"
+    assert metadata["mentions_currency"] is True
+    assert metadata["mentions_dates"] is True
+
+
+def test_extract_metadata_uses_precomputed_allowed_fields(tmp_path: Path) -> None:
+    doc = tmp_path / "memo.md"
+    doc.write_text("No money here.")
+    schema_def = {"fields": [{"name": "filename"}, {"name": "extension"}]}
+
+    from_schema = metadata_module.extract_metadata(
+        file_path=str(doc),
+        root_path=str(tmp_path),
+        content=doc.read_text(),
+        schema_def=schema_def,
+    )
+    precomputed = metadata_module.extract_metadata(
+        file_path=str(doc),
+        root_path=str(tmp_path),
+        content=doc.read_text(),
+        schema_def=schema_def,
+        allowed_fields=frozenset({"filename", "extension"}),
+    )
+
+    assert from_schema == precomputed == {"filename": "memo.md", "extension": ".md"}
+
+
+def test_langextract_skips_blank_content(monkeypatch) -> None:
+    fake_lx = MagicMock()
+    monkeypatch.setitem(sys.modules, "langextract", fake_lx)
+    monkeypatch.setenv("GOOGLE_API_KEY", "fake-key")
+
+    metadata = metadata_module._extract_langextract_metadata(content=" \n\t ")
+
+    assert metadata["lx_enabled"] is False
+    assert metadata["lx_extraction_count"] == 0
+    fake_lx.extract.assert_not_called()
+
+
 def test_indexing_pipeline_indexes_and_marks_deleted(
     tmp_path: Path,
     monkeypatch,
@@ -379,6 +530,78 @@ def test_auto_discover_profile_with_mock_llm(
     assert "lx_enabled" in field_names
 
 
+def test_auto_discover_profile_strips_markdown_fence(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    (corpus / "contract.md").write_text("TechCorp acquires StartupXYZ.")
+    monkeypatch.setenv("GOOGLE_API_KEY", "fake-key")
+
+    fields = [
+        {
+            "name": "lx_people",
+            "type": "string",
+            "source": "entities",
+            "source_classes": ["person"],
+            "mode": "values",
+        }
+    ]
+    mock_response = MagicMock()
+    mock_response.text = (
+        "```json\n" + json.dumps({"name": "fenced", "fields": fields}) + "\n```"
+    )
+    mock_client_instance = MagicMock()
+    mock_client_instance.models.generate_content.return_value = mock_response
+
+    with patch(
+        "fs_explorer.indexing.metadata._get_genai_client",
+        return_value=mock_client_instance,
+    ):
+        profile = auto_discover_profile(str(corpus))
+
+    assert profile["name"] == "fenced"
+    assert "lx_people" in {f["name"] for f in profile["fields"]}
+
+
+def test_auto_discover_profile_parses_samples_concurrently(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    import threading
+
+    import fs_explorer.fs as fs_module
+
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    for name in ("a.md", "b.md", "c.md"):
+        (corpus / name).write_text(f"Body of {name}")
+    monkeypatch.setenv("GOOGLE_API_KEY", "fake-key")
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def parse_together(file_path: str) -> str:
+        barrier.wait()
+        if file_path.endswith("b.md"):
+            raise RuntimeError("unparseable")
+        return Path(file_path).read_text()
+
+    monkeypatch.setattr(fs_module, "parse_file", parse_together)
+    mock_client_instance = MagicMock()
+    mock_client_instance.models.generate_content.return_value.text = "not json"
+
+    with patch(
+        "fs_explorer.indexing.metadata._get_genai_client",
+        return_value=mock_client_instance,
+    ):
+        auto_discover_profile(str(corpus), sample_count=3)
+
+    prompt = mock_client_instance.models.generate_content.call_args.kwargs["contents"]
+    assert "--- a.md ---\nBody of a.md\n\n--- c.md ---\nBody of c.md" in prompt
+    assert "b.md" not in prompt
+
+
 def test_auto_discover_profile_falls_back_on_error(
     tmp_path: Path,
     monkeypatch,
@@ -416,14 +639,15 @@ def test_auto_discover_profile_falls_back_without_api_key(
     corpus.mkdir()
     (corpus / "file.md").write_text("Some content.")
 
-    monkeypatch.setattr(
-        pipeline_module,
-        "parse_file",
-        lambda file_path: Path(file_path).read_text(),
-    )
+    import fs_explorer.fs as fs_module
+
+    parse_file = MagicMock(side_effect=lambda file_path: Path(file_path).read_text())
+    monkeypatch.setattr(pipeline_module, "parse_file", parse_file)
+    monkeypatch.setattr(fs_module, "parse_file", parse_file)
     monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
 
     profile = auto_discover_profile(str(corpus))
+    parse_file.assert_not_called()
 
     default_names = {
         f["name"] for f in metadata_module._DEFAULT_LANGEXTRACT_PROFILE["fields"]
@@ -390,6 +390,89 @@ def test_semantic_search_includes_field_catalog_on_first_call(
         agent_module.clear_index_context()
 
 
+def test_indexed_tools_reuse_one_storage_connection(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    import fs_explorer.agent as agent_module
+
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    (corpus / "a_agreement.md").write_text("Purchase price is $45,000,000.")
+
+    monkeypatch.setattr(
+        pipeline_module,
+        "parse_file",
+        lambda file_path: Path(file_path).read_text(),
+    )
+
+    db_path = str(tmp_path / "index.duckdb")
+    IndexingPipeline(storage=DuckDBStorage(db_path)).index_folder(str(corpus))
+
+    agent_module.set_index_context(str(corpus), db_path)
+    try:
+        assert "a_agreement.md" in agent_module.list_indexed_documents()
+        storage = agent_module._INDEX_STORAGE
+        assert storage is not None
+
+        context = agent_module._INDEX_CONTEXT
+        assert context is not None and context.corpus_id is not None
+
+        agent_module.list_indexed_documents()
+        assert agent_module._INDEX_STORAGE is storage
+
+        doc_id = storage.list_documents(corpus_id=context.corpus_id)[0]["id"]
+        assert "$45,000,000" in agent_module.get_document(doc_id)
+
+        # A re-index through the same connection is visible right away.
+        (corpus / "a_agreement.md").write_text("Purchase price is $50,000,000.")
+        IndexingPipeline(storage=storage).index_folder(str(corpus))
+        assert "$50,000,000" in agent_module.get_document(doc_id)
+    finally:
+        agent_module.clear_index_context()
+    assert agent_module._INDEX_STORAGE is None
+
+
+def test_get_document_skips_content_for_deleted_documents(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    import fs_explorer.agent as agent_module
+
+    corpus = tmp_path / "docs"
+    corpus.mkdir()
+    (corpus / "a_agreement.md").write_text("Purchase price is $45,000,000.")
+
+    monkeypatch.setattr(
+        pipeline_module,
+        "parse_file",
+        lambda file_path: Path(file_path).read_text(),
+    )
+
+    db_path = str(tmp_path / "index.duckdb")
+    storage = DuckDBStorage(db_path)
+    result = IndexingPipeline(storage=storage).index_folder(str(corpus))
+    doc_id = storage.list_documents(corpus_id=result.corpus_id)[0]["id"]
+    storage.mark_deleted_missing_documents(
+        corpus_id=result.corpus_id, active_relative_paths=set()
+    )
+    storage.close()
+
+    agent_module.set_index_context(str(corpus), db_path)
+    try:
+        assert "No indexed documents" in agent_module.list_indexed_documents()
+        assert agent_module._INDEX_STORAGE is not None
+        monkeypatch.setattr(
+            agent_module._INDEX_STORAGE,
+            "get_document",
+            lambda **_: pytest.fail("content fetched for a deleted document"),
+        )
+        assert "marked as deleted" in agent_module.get_document(doc_id)
+        assert "No indexed document" in agent_module.get_document("missing")
+    finally:
+        agent_module.clear_index_context()
+
+
 def test_float_scoring_in_ranked_documents() -> None:
     from fs_explorer.search.ranker import RankedDocument, rank_documents
 